@@ -1,20 +1,27 @@
 """This is the main python package for the autoplot IPython extension."""
-from argparse import Namespace
 
-import IPython
-from IPython.core.magic import magics_class, Magics, line_magic
-from IPython.core.magic_arguments import magic_arguments, argument, parse_argstring
-from autoplot.utils import remove_quotes
-from autoplot.utils.constants import FigSize, DEFAULT_MAX_SERIES_LENGTH
+# names re-exported from submodules, resolved lazily in `__getattr__` so that
+# importing `autoplot` does not pull in pandas / matplotlib / dtale
+_LAZY_IMPORTS = {
+    "AutoplotDisplay": "autoplot.extensions.autoplot_display",
+    "DTaler": "autoplot.dtaler",
+    "Plotter": "autoplot.plotter",
+    "PlotterModel": "autoplot.plotter",
+    "Toast": "autoplot.extensions.toast",
+    "ViewManager": "autoplot.view_manager",
+}
 
-from ipywidgets import widgets
-from IPython.core.interactiveshell import ExecutionResult
 
-from autoplot.view_manager import ViewManager
-from autoplot.dtaler import DTaler
-from autoplot.extensions.autoplot_display import AutoplotDisplay
-from autoplot.extensions.toast import Toast
-from autoplot.plotter import Plotter, PlotterModel
+def __getattr__(name):
+    """Resolve the lazily re-exported names. Called on attribute miss (PEP 562)."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
 
 
 def load_ipython_extension(shell):
@@ -25,11 +32,24 @@ def load_ipython_extension(shell):
     the IPython event listeners defined in `CellEventHandler` and registers the magic
     commands defined in `AutoplotMagic`.
 
+    The heavy dependencies (ipywidgets, pandas, matplotlib via `Plotter`, dtale via
+    `DTaler`) are imported here rather than at module level, so that simply importing
+    `autoplot` stays cheap.
+
     Parameters
     ----------
     shell: IPython.InteractiveShell
         The active IPython shell.
     """
+    import IPython
+    from ipywidgets import widgets
+
+    from autoplot.dtaler import DTaler
+    from autoplot.extensions.autoplot_display import AutoplotDisplay
+    from autoplot.extensions.toast import Toast
+    from autoplot.plotter import Plotter, PlotterModel
+    from autoplot.view_manager import ViewManager
+
     js_output = widgets.Output()
 
     toast = Toast(js_output)
@@ -39,18 +59,27 @@ def load_ipython_extension(shell):
 
     def _autoplot_post_run_cell(*args):
         if args:
-            success = args[0].success
+            result = args[0]
+            success = result.success
+            # the cell source lets redraw restrict its namespace scan
+            raw_cell = getattr(getattr(result, "info", None), "raw_cell", None)
         else:
             # IPython 5.x didn't use to pass the result as a parameter of post_run_cell
             success = IPython.get_ipython().last_execution_succeeded
+            raw_cell = None
         if success:
-            view_manager.redraw()
-
-    # Unregister previous events registered with this class (eg.: when the plugin reloads)
-    for name, funcs in shell.events.callbacks.items():
-        for func in funcs:
-            if _autoplot_post_run_cell.__name__ == func.__name__:
-                shell.events.unregister(name, func)
+            view_manager.redraw(raw_cell)
+
+    # Unregister previous events registered with this class (eg.: when the plugin reloads).
+    # Only post_run_cell is ever registered, so there is no need to scan other events
+    for func in list(shell.events.callbacks["post_run_cell"]):
+        # compare the module as well as the name to avoid false matches with callbacks
+        # of the same name registered by other extensions
+        if (
+            getattr(func, "__name__", "") == _autoplot_post_run_cell.__name__
+            and getattr(func, "__module__", "") == _autoplot_post_run_cell.__module__
+        ):
+            shell.events.unregister("post_run_cell", func)
     shell.events.register("post_run_cell", _autoplot_post_run_cell)
 
     apm = _make_magic(shell, toast, view_manager)
@@ -58,6 +87,19 @@ def load_ipython_extension(shell):
 
 
 def _make_magic(shell, toast, view_manager):
+    from argparse import Namespace
+    from itertools import chain
+    from typing import Dict, Optional
+
+    import IPython
+    from IPython.core.magic import magics_class, Magics, line_magic
+    from IPython.core.magic_arguments import magic_arguments, argument, parse_argstring
+
+    from autoplot.extensions.toast import Toast
+    from autoplot.utils import remove_quotes
+    from autoplot.utils.constants import FigSize, DEFAULT_MAX_SERIES_LENGTH
+    from autoplot.view_manager import ViewManager
+
     @magics_class
     class AutoplotMagic(Magics):
         """Class to define and handle IPython magic commands for the autoplot extension.
@@ -86,21 +128,25 @@ def _make_magic(shell, toast, view_manager):
             self.toast = toast
             self.view_manager = view_manager
 
+            # parsed argument namespaces keyed on the raw argument string, so
+            # repeated identical invocations skip shlex + argparse entirely
+            self._parse_cache: Dict[str, Namespace] = {}
+
         @line_magic
         @magic_arguments()
         @argument(
             "-w",
             "--width",
             type=float,
-            help=f"Set the width of the plot in inches. Must be in range {FigSize.MIN_WIDTH.value}-"
-            f"{FigSize.MAX_WIDTH.value}. The default is {FigSize.DEFAULT_WIDTH.value}.",
+            help=f"Set the width of the plot in inches. Must be in range {FigSize.MIN_WIDTH}-"
+            f"{FigSize.MAX_WIDTH}. The default is {FigSize.DEFAULT_WIDTH}.",
         )
         @argument(
             "-h",
             "--height",
             type=float,
-            help=f"Set the height of the plot in inches. Must be in range {FigSize.MIN_HEIGHT.value}-"
-            f"{FigSize.MAX_HEIGHT.value}. The default is {FigSize.DEFAULT_HEIGHT.value}.",
+            help=f"Set the height of the plot in inches. Must be in range {FigSize.MIN_HEIGHT}-"
+            f"{FigSize.MAX_HEIGHT}. The default is {FigSize.DEFAULT_HEIGHT}.",
         )
         @argument(
             "-r",
@@ -172,7 +218,12 @@ def _make_magic(shell, toast, view_manager):
             To modify the plot or traces, use the command `%autoplot` with one of more of
             the optional arguments.:
             """
-            args: Namespace = parse_argstring(self.autoplot, arg_string)
+            args: Optional[Namespace] = self._parse_cache.get(arg_string)
+            if args is None:
+                args = parse_argstring(self.autoplot, arg_string)
+                if len(self._parse_cache) >= 64:
+                    self._parse_cache.clear()
+                self._parse_cache[arg_string] = args
 
             # handle resize arguments
             if args.width is not None:
@@ -185,15 +236,15 @@ def _make_magic(shell, toast, view_manager):
                 for var, label in args.rename:
                     self.view_manager.rename_variable(self.toast, var, label)
 
+            # args.ignore / args.show are nested lists ("-i A -i B C" => [[A], [B, C]]);
+            # flatten them in C via chain rather than a nested Python loop
             if args.ignore is not None:
-                for a in args.ignore:
-                    for var in a:
-                        self.view_manager.ignore_variable(self.toast, var)
+                for var in chain.from_iterable(args.ignore):
+                    self.view_manager.ignore_variable(self.toast, var)
 
             if args.show is not None:
-                for a in args.show:
-                    for var in a:
-                        self.view_manager.show_variable(self.toast, var)
+                for var in chain.from_iterable(args.show):
+                    self.view_manager.show_variable(self.toast, var)
 
             if args.colour is not None:
                 for var, colour in args.colour:
@@ -1,7 +1,7 @@
 import time
 
 from pkg_resources import resource_filename
-from typing import Dict, Union, List, Tuple, Optional, NamedTuple, Set, Iterable, Sequence
+from typing import Dict, Union, List, Tuple, Optional, Set, Iterable, Sequence
 
 import dtale
 import dtale.views
@@ -16,10 +16,21 @@ from autoplot.view_manager import View
 DataId = str
 VariableName = str
 
+# the "no dataframe shown" placeholder, built on first use and shared between
+# draws so the pkg_resources lookup and PNG read happen at most once
+_placeholder_image: Optional[Image] = None
 
-class VarData(NamedTuple):
-    pdf: Union[pd.Series, pd.DataFrame]
-    dd: dtale.views.DtaleData
+
+def _get_placeholder_image() -> Image:
+    global _placeholder_image
+    if _placeholder_image is None:
+        _placeholder_image = Image(data=resource_filename(__name__, "assets/imgs/dtale.png"))
+    return _placeholder_image
+
+
+def _var_fingerprint(var: Union[pd.Series, pd.DataFrame]) -> Tuple:
+    """Return a cheap fingerprint of a variable, used to detect in-place changes."""
+    return (id(var), getattr(var, "shape", None), len(var))
 
 
 class DTaler(View):
@@ -32,9 +43,13 @@ class DTaler(View):
     """
 
     def __init__(self) -> None:
-        # This is the current state of the variables we track. The tracked dict are the active variables, ignored and
-        # forced_shown are variables the user wants to either ignore or stop ignoring
-        self._tracked: Dict[str, VarData] = {}
+        # This is the current state of the variables we track, laid out as parallel dicts keyed by variable name so
+        # each access path only touches what it needs: draw / removal read the dtale handles, the update filter reads
+        # the pandas objects and fingerprints. ignored and forced_shown are variables the user wants to either ignore
+        # or stop ignoring
+        self._tracked_dd: Dict[str, dtale.views.DtaleData] = {}
+        self._tracked_pdf: Dict[str, Union[pd.Series, pd.DataFrame]] = {}
+        self._tracked_fp: Dict[str, Tuple] = {}
         self._ignored: Set[str] = set()
         self._frozen = False
 
@@ -50,9 +65,10 @@ class DTaler(View):
         self._updated: List[DataId] = []
         self._deleted: List[DataId] = []
 
-        # This is a helper variable used to check whether it's the first time dtale.show is called. Due to race
-        # conditions in the package, we can't call show twice too fast.
-        self._first_show = True
+        # Timestamp of the first dtale.show call, if no other call has happened since. Due to race conditions in the
+        # package, we can't call show twice too fast, so the second call waits out whatever is left of the grace
+        # period. Cells that only ever show one dataframe never pay the wait at all.
+        self._first_show_time: Optional[float] = None
 
     def update_variables(self, pandas_vars: Dict[str, Union[pd.Series, pd.DataFrame]]) -> None:
         # These variables are populated with the difference between the current state and the new variables
@@ -61,18 +77,28 @@ class DTaler(View):
         self._deleted = []
         self._force_show = []
 
+        # nothing in the namespace and nothing tracked or pending - the common case
+        # before the user has defined any dataframe - so skip the bookkeeping below
+        if not pandas_vars and not self._tracked_dd and not self._ignored and not self._ignore_next and not self._show_next:
+            return
+
+        # live key views: they follow the mutations below and support set algebra
+        # directly, so no `set(...)` copies need to be rebuilt at each step
+        tracked_keys = self._tracked_dd.keys()
+        new_keys = pandas_vars.keys()
+
         # 1. The first step is to clean up our internal structures, so it matches what is in dtale and what is currently
         #    available in the namespace.
 
         #   1.a. Remove and ignore variables deleted in dtale
-        removed = _removed_in_dtale(self._tracked.items())
+        removed = _removed_in_dtale(self._tracked_dd.items())
         for name in removed:
             self._remove_tracked_var(name)
             self._ignored.add(name)
 
         #   1.b. Clean up all variables that are not in the namespace anymore. If they were deleted in dtale and from
         #        the namespace, completely forget about the name, rather than keeping it in the ignore list.
-        for name in (self._ignored | set(self._tracked.keys())) - set(pandas_vars.keys()):
+        for name in (self._ignored | tracked_keys) - new_keys:
             self._remove_tracked_var(name)
             if name in self._ignored:
                 self._ignored.remove(name)
@@ -80,48 +106,56 @@ class DTaler(View):
         # 2. Ignore all new variables when frozen. Add to ignored all variables the user wants to ignore but remove all.
         #    variables they want to show.
         if self._frozen:
-            self._ignored |= set(pandas_vars.keys()) - set(self._tracked.keys())
+            self._ignored |= new_keys - tracked_keys
         # TODO: Currently, we do not know the order variables are shown/ignored so show will have precendence over
         #       ignore if they are both executed in the same cell.
-        self._ignored |= set(self._ignore_next)
-        self._ignored -= set(self._show_next)
+        self._ignored.update(self._ignore_next)
+        self._ignored.difference_update(self._show_next)
         self._force_show = self._show_next
 
         #   2.a. clean up user intentions now that we've consumed them.
         self._ignore_next, self._show_next = [], []
 
-        # 3. Now that we know which variables to ignore, make sure they are all removed from the tracked dict as needed.
-        for name in self._ignored:
+        # 3. Now that we know which variables to ignore, make sure they are all removed from the tracked dicts as
+        #    needed. Only the intersection needs visiting - the ignore set accumulates over a session, and most of it
+        #    is long gone from the tracked state.
+        for name in self._ignored & tracked_keys:
             self._remove_tracked_var(name)
 
         # 4. Start tracking variables which are not ignored
-        for name in set(pandas_vars.keys()) - (set(self._tracked.keys()) | self._ignored):
+        for name in new_keys - tracked_keys - self._ignored:
             self._add_tracked_var(name, pandas_vars[name])
 
-        # 5. Update tracked variables which have changed
-        updated_variables = _filter_updated(pandas_vars.items(), self._tracked.copy())
+        # 5. Update tracked variables which have changed. _filter_updated only reads the tracked state and its result
+        #    is fully built before any mutation below, so no defensive copy is needed (cell execution is
+        #    single-threaded in IPython).
+        updated_variables = _filter_updated(pandas_vars.items(), self._tracked_pdf, self._tracked_fp)
         for name, var in updated_variables.items():
             self._update_tracked_var(name, var)
 
     def draw(self, force: bool, output: AutoplotDisplay) -> None:
+        # when nothing changed in the last cell the draw is guaranteed to be a
+        # no-op, so skip the dtale instance lookup below entirely
+        if not force and not self._force_show and not self._new and not self._updated and not self._deleted:
+            return
+
         refresh = False
         current = dtale.get_instance(output.data_id)
         if current is None:
-            current = Image(data=resource_filename(__name__, "assets/imgs/dtale.png"))
+            current = _get_placeholder_image()
         # The conditionals below encode precedence. Whatever the user wants to show takes is the preferred value to
-        # display, followed by new values and so on.
-        if set(self._force_show) & set(self._tracked.keys()):
-            for key in reversed(self._force_show):
-                if key in self._tracked:
-                    current = self._tracked[key].dd
-                    refresh = True
-                    break
-        elif set(self._new) & set(self._tracked.keys()):
-            for key in reversed(self._new):
-                if key in self._tracked:
-                    current = self._tracked[key].dd
-                    refresh = True
-                    break
+        # display, followed by new values and so on. The loops membership-test the
+        # (usually much larger) tracked dict directly rather than materialising
+        # intersection sets just to check for a hit.
+        show_key = _last_tracked(self._force_show, self._tracked_dd)
+        new_key = _last_tracked(self._new, self._tracked_dd) if show_key is None else None
+
+        if show_key is not None:
+            current = self._tracked_dd[show_key]
+            refresh = True
+        elif new_key is not None:
+            current = self._tracked_dd[new_key]
+            refresh = True
         elif self._updated:
             if output.data_id in self._updated:
                 refresh = True
@@ -160,47 +194,71 @@ class DTaler(View):
         self._show_next.append(var_name)
 
     def _dtale_show(self, *args, **kwargs) -> dtale.views.DtaleData:
+        if self._first_show_time is not None:
+            # rather than sleeping unconditionally after the first show, wait out only what is left of the grace
+            # period here, overlapping it with whatever work ran in between
+            remaining = 0.3 - (time.time() - self._first_show_time)
+            if remaining > 0:
+                time.sleep(remaining)
+            self._first_show_time = None
+            return dtale.show(*args, **kwargs)
+
         result = dtale.show(*args, **kwargs)
-        if self._first_show:
-            # when running show for the first time, if that happens in rapid succession, it can cause race conditions
-            # internal to dtale
-            time.sleep(0.3)
-            self._first_show = False
+        if self._first_show_time is None and not self._tracked_dd:
+            self._first_show_time = time.time()
         return result
 
     def _remove_tracked_var(self, var_name: str):
-        vardata = self._tracked.pop(var_name, None)
-        if vardata:
-            data_id = vardata.dd._data_id
+        dd = self._tracked_dd.pop(var_name, None)
+        if dd is not None:
+            self._tracked_pdf.pop(var_name, None)
+            self._tracked_fp.pop(var_name, None)
+            data_id = dd._data_id
             dtale.global_state.cleanup(data_id)
-            self._deleted.append(vardata.dd._data_id)
+            self._deleted.append(data_id)
 
     def _add_tracked_var(self, name, var):
         dd = self._dtale_show(data=var, ignore_duplicate=True, reaper_on=False, name=name, hide_shutdown=True)
-        self._tracked[name] = VarData(pdf=var, dd=dd)
+        self._tracked_dd[name] = dd
+        self._tracked_pdf[name] = var
+        self._tracked_fp[name] = _var_fingerprint(var)
         self._new.append(name)
 
     def _update_tracked_var(self, name, var):
-        vardata = self._tracked[name]
-        vardata.dd.data = var
-        self._tracked[name] = VarData(pdf=var, dd=vardata.dd)
-        self._updated.append(vardata.dd._data_id)
+        dd = self._tracked_dd[name]
+        dd.data = var
+        self._tracked_pdf[name] = var
+        self._tracked_fp[name] = _var_fingerprint(var)
+        self._updated.append(dd._data_id)
+
+
+def _last_tracked(names: Sequence[VariableName], tracked: Dict[str, dtale.views.DtaleData]) -> Optional[VariableName]:
+    """Return the most recently appended name that is still tracked, or `None`."""
+    for name in reversed(names):
+        if name in tracked:
+            return name
+    return None
 
 
 def _removed_in_dtale(tracked: Iterable) -> Set[str]:
-    removed: Set[str] = set()
-    for name, vardata in tracked:
-        if dtale.get_instance(vardata.dd._data_id) is None:
-            removed.add(name)
-    return removed
+    # snapshot the live data ids once and membership-test against the set, rather
+    # than calling `dtale.get_instance` (a global-state lookup) per tracked variable
+    live = {str(data_id) for data_id in dtale.global_state.keys()}
+    return {name for name, dd in tracked if str(dd._data_id) not in live}
 
 
-def _filter_updated(pandas_vars: Iterable, tracked: Dict[str, VarData]) -> Dict[str, Union[pd.Series, pd.DataFrame]]:
+def _filter_updated(
+    pandas_vars: Iterable,
+    tracked_pdf: Dict[str, Union[pd.Series, pd.DataFrame]],
+    tracked_fp: Dict[str, Tuple],
+) -> Dict[str, Union[pd.Series, pd.DataFrame]]:
     result: Dict[str, Union[pd.Series, pd.DataFrame]] = {}
 
     for name, var in pandas_vars:
-        vardata = tracked.get(name)
-        if vardata is not None and vardata.pdf is not var:
+        pdf = tracked_pdf.get(name)
+        # reassignments change the identity; in-place additions / deletions change
+        # the shape, which the identity check alone would miss
+        if pdf is not None and (pdf is not var or tracked_fp.get(name) != _var_fingerprint(var)):
             result[name] = var
 
     return result
@@ -211,4 +269,4 @@ def _next_dtale_data():
     if data_id is not None:
         return dtale.get_instance(data_id)
     else:
-        return Image(data=resource_filename(__name__, "assets/imgs/dtale.png"))
+        return _get_placeholder_image()
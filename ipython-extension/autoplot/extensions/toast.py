@@ -11,11 +11,19 @@ Toast
     Class to display JupyterLab toasts via DOM events.
 """
 
+import os
 from enum import Enum
 
 from IPython.core.display import Javascript, display
 from ipywidgets import widgets
 
+# template formatted once per toast, rather than rebuilding the f-string literal.
+# Bound to the `format` method so `show` does a single call
+_JS_TEMPLATE = """document.dispatchEvent(new CustomEvent(
+            'autoplot-toast', {{ detail: {{
+                message: `{}`, type: `{}`,
+            }} }} ))""".format
+
 
 class ToastType(Enum):
     """Enum class defining different toast types."""
@@ -61,6 +69,9 @@ class Toast(object):
             re-shown on page refresh.
         """
         self._js_output = js_output
+        # headless runs (CI, papermill) have no frontend listening for the DOM
+        # events, so allow toasts to be disabled to skip the comm round-trips
+        self._enabled = os.environ.get("AUTOPLOT_TOASTS", "1") != "0"
         display(self._js_output)
 
     def show(self, message: str, toast_type: ToastType):
@@ -80,13 +91,11 @@ class Toast(object):
         """
         assert "`" not in message, "Message cannot contain '`'"
 
-        js = f"""document.dispatchEvent(new CustomEvent(
-                    'autoplot-toast', {{ detail: {{
-                        message: `{message}`, type: `{toast_type.value}`,
-                    }} }} ))"""
+        if not self._enabled:
+            return
 
         with self._js_output:
-            display(Javascript(js))  # noqa
+            display(Javascript(_JS_TEMPLATE(message, toast_type.value)))  # noqa
 
         self._js_output.clear_output()
 
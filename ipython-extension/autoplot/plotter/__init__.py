@@ -6,26 +6,34 @@ Plotter
     Class to manage `Trace` instances and handle the graph plotting.
 """
 
+import contextlib
 import datetime
-from typing import Any, Dict, Optional, Set, Union
+import math
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-import matplotlib.pyplot as plt
-import mpld3
 import numpy as np
 import pandas as pd
 from ipywidgets import widgets
-from IPython.display import clear_output
+from IPython.display import clear_output, display
 
 from autoplot.view_manager import is_plottable, View
 from autoplot.extensions.toast import Toast, ToastType
 from autoplot.plotter.range_selector_utils import gen_range_selector_labels
 from autoplot.plotter.trace import Trace
-from autoplot.plugins import InteractiveLegend, RangeSelectorButtons, SaveImageButtons, TimeSeriesTooltip
 from autoplot.utils.constants import DEFAULT_MAX_SERIES_LENGTH, DF_COLUMN_FORMAT_STRING, FigSize
 from autoplot.utils import remove_quotes
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 OptDatetime = Optional[datetime.datetime]
 
+# the figure margins are tuned for a 13x4 inch figure; other sizes scale their
+# margins from this baseline
+_MARGIN_BASE_WIDTH = 13.0
+_MARGIN_BASE_HEIGHT = 4.0
+
 
 class Plotter(object):
     """Class to manage `Trace` instances and handle the graph plotting.
@@ -98,15 +106,46 @@ class Plotter(object):
         # be made visible using magic commands)
         self.force_shown: Set[str] = set()
 
+        # names of currently visible traces, kept in step by the visibility
+        # mutators so nothing has to rescan every trace to find them
+        self._visible: Set[str] = set()
+
         # optional plot parameters
         self._ylabel: Optional[str] = None
-        self._width: int = FigSize.DEFAULT_WIDTH.value
-        self._height: int = FigSize.DEFAULT_HEIGHT.value
+        self._width: int = FigSize.DEFAULT_WIDTH
+        self._height: int = FigSize.DEFAULT_HEIGHT
 
         # flag that is set to True if a change has been made. If it is False when
         # self.plot() is called, nothing will happen. Initialise to True for placeholder
         self._changed = True
 
+        # categorized dirty state: names of traces whose data or colour changed,
+        # and whether anything structural (trace set, labels, downsampling, figure
+        # layout) changed. Data and colour changes can reuse the cached figure; a
+        # structural one cannot. Labels count as structural because the legend
+        # plugin captures them when the figure is built
+        self._dirty_series: Set[str] = set()
+        self._dirty_cosmetic: Set[str] = set()
+        self._dirty_structural = True
+
+        # the cached figure, axes and the lines added to them, keyed by trace name.
+        # Rebuilt on structural changes, reused for data-only updates
+        self._fig: Optional["plt.Figure"] = None
+        self._ax: Optional["plt.Axes"] = None
+        self._fig_lines: Dict[str, Any] = {}
+
+        # the save-image plugin takes constant input and keeps no per-figure
+        # state, so one instance is built on first plot and reused thereafter
+        self._save_buttons_plugin: Optional[Any] = None
+
+        # set once the mpld3 notebook display hook has been registered; the
+        # registration is idempotent but not free, so do it on the first plot only
+        self._mpld3_enabled = False
+
+        # (total_range, min_step) -> labels memo for the range selector buttons;
+        # steady-state replots regenerate identical labels otherwise
+        self._range_label_cache: Tuple[Optional[float], Optional[float], Optional[List[str]]] = (None, None, None)
+
         # if True, no new traces will be added to the plot. Existing ones will still
         # be updated
         self._frozen = False
@@ -114,11 +153,17 @@ class Plotter(object):
         # if a series is longer than this, it will be downsampled
         self._max_series_length = DEFAULT_MAX_SERIES_LENGTH
 
+        # depth of nested `batch_updates` contexts, and the arguments of a `plot`
+        # call deferred until the outermost context exits
+        self._batch_depth = 0
+        self._deferred_plot: Optional[Tuple[bool, widgets.Output]] = None
+
     def __getitem__(self, item: str) -> Trace:
         return self._traces[item]
 
     def __setitem__(self, key: str, value: Trace):
-        assert key not in self._traces, "Cannot overwrite existing trace"
+        # existence is already checked by add_trace, the only caller that can
+        # introduce new keys, so no duplicate membership test here
         self._traces[key] = value
 
     def add_trace(self, name: str, series: pd.Series, df_name: Union[str, None]):
@@ -140,9 +185,11 @@ class Plotter(object):
 
         if name in self._traces:
             # if it already exists, overwrite it and reset its visibility. This allows
-            # deleted traces to be redefined
+            # deleted traces to be redefined. Redefinitions that change nothing (same
+            # data, same visibility) leave the dirty state alone, so a rerun of the
+            # defining cell does not trigger a structural replot
             self.update_trace_series(name, series)
-            self[name].update_visible(not self._frozen)
+            structural_change = self._traces[name].update_visible(not self._frozen)
         else:
             # add new trace
             self[name] = Trace(
@@ -154,8 +201,19 @@ class Plotter(object):
                 visible=not self._frozen,
                 df_name=df_name,
             )
+            structural_change = True
 
-        self._changed = not self._frozen
+        if self._traces[name].is_visible():
+            self._visible.add(name)
+        else:
+            self._visible.discard(name)
+
+        if not self._frozen:
+            if structural_change:
+                self._changed = True
+                self._dirty_structural = True
+        else:
+            self._changed = False
 
     def update_trace_series(self, name: str, series: pd.Series):
         """Update the series of an existing trace.
@@ -170,9 +228,10 @@ class Plotter(object):
         series: pd.Series
             The new series.
         """
-        tr = self[name]
+        tr = self._traces[name]
         if tr.update_series(series) and tr.is_visible():
             self._changed = True
+            self._dirty_series.add(name)
 
     def update_trace_colour(self, name: str, colour: str):
         """Update the colour of an existing trace.
@@ -187,9 +246,10 @@ class Plotter(object):
         colour: str
             The new colour.
         """
-        tr = self[name]
+        tr = self._traces[name]
         if tr.update_colour(colour) and tr.is_visible():
             self._changed = True
+            self._dirty_cosmetic.add(name)
 
     def update_trace_label(self, name: str, label: str):
         """Update the legend label of an existing trace.
@@ -204,9 +264,10 @@ class Plotter(object):
         label: str
             The new label.
         """
-        tr = self[name]
+        tr = self._traces[name]
         if tr.update_label(label) and tr.is_visible():
             self._changed = True
+            self._dirty_structural = True
 
     def update_max_series_length(self, max_length: int):
         """Update the maximum series length of all traces.
@@ -227,9 +288,10 @@ class Plotter(object):
         if self._max_series_length == max_length:
             return
 
-        for _, tr in self._traces.items():
+        for tr in self._traces.values():
             if tr.update_max_series_length(max_length) and tr.is_visible():
                 self._changed = True  # set to true if any trace changes
+                self._dirty_structural = True
 
         self._max_series_length = max_length
 
@@ -243,14 +305,13 @@ class Plotter(object):
         name: str
             Name of the associated variable. Must exist in `self._traces`.
         """
-        if self[name].update_visible(False):
-            try:
-                # should exist, but does not matter if it does not
-                self.force_shown.remove(name)
-            except KeyError:
-                pass
+        if self._traces[name].update_visible(False):
+            self._visible.discard(name)
+            # should exist, but does not matter if it does not
+            self.force_shown.discard(name)
 
             self._changed = True
+            self._dirty_structural = True
 
     def force_show_trace(self, name: str):
         """Show a previously hidden or deleted trace.
@@ -263,9 +324,11 @@ class Plotter(object):
         name: str
             Name of the associated variable. Must exist in `self._traces`.
         """
-        if self[name].update_visible(True):
+        if self._traces[name].update_visible(True):
+            self._visible.add(name)
             self.force_shown.add(name)
             self._changed = True
+            self._dirty_structural = True
 
     def set_figure_width(self, width: int):
         """Set the width of the figure.
@@ -280,6 +343,7 @@ class Plotter(object):
         if self._width != width:
             self._width = width
             self._changed = True
+            self._dirty_structural = True
 
     def set_figure_height(self, height: int):
         """Set the height of the figure.
@@ -294,6 +358,7 @@ class Plotter(object):
         if self._height != height:
             self._height = height
             self._changed = True
+            self._dirty_structural = True
 
     def set_ylabel(self, ylabel: str):
         """Set the y axis label.
@@ -308,9 +373,11 @@ class Plotter(object):
         if ylabel == "" and self._ylabel is not None:
             self._ylabel = None
             self._changed = True
+            self._dirty_structural = True
         elif self._ylabel != ylabel:
             self._ylabel = ylabel
             self._changed = True
+            self._dirty_structural = True
 
     def freeze(self):
         """Set the plotter to frozen, preventing new traces from being added."""
@@ -335,11 +402,29 @@ class Plotter(object):
 
         self._frozen = False
 
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """Defer any `plot` call made in this context until the context exits.
+
+        Trace mutations made back-to-back (e.g. while processing a cell's namespace)
+        then result in at most one render. The context is reentrant; nested uses
+        still produce a single render on the outermost exit.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._deferred_plot is not None:
+                force, graph_output = self._deferred_plot
+                self._deferred_plot = None
+                self.plot(force, graph_output)
+
     def get_visible(self) -> Set[str]:
         """Return a set of variable names corresponding to visible traces."""
-        return set(name for name in self._traces.keys() if self[name].is_visible())
+        return set(self._visible)
 
-    def _adjust_fig_margins(self, fig: plt.Figure, y_max: float):
+    def _adjust_fig_margins(self, fig: "plt.Figure", y_max: float):
         """Set the figure margins based on its desired width and height.
 
         Parameters
@@ -350,25 +435,27 @@ class Plotter(object):
         y_max: float
             The maximum absolute y axis tick value.
         """
-        # the appropriate margins for a figure of size 13x4 are known (i.e. 0.06, 0.94,
-        # 0.85, 0.23) thus these values can be used to scale the margins for different
-        # figure sizes
-        default_width = 13
-        default_height = 4
+        # the appropriate margins for a figure of the baseline size are known (i.e.
+        # 0.06, 0.94, 0.85, 0.23) thus these values can be used to scale the margins
+        # for different figure sizes. The width / height factors are shared by several
+        # margins, so compute them once
+        width_factor = _MARGIN_BASE_WIDTH / self._width
+        height_factor = _MARGIN_BASE_HEIGHT / self._height
 
         if y_max >= 1e5:
-            extra = 0.008 * (np.log10(y_max) - 5)
+            # math.log10 avoids a numpy scalar dispatch for a single value
+            extra = 0.008 * (math.log10(y_max) - 5)
         else:
             extra = 0
 
         if self._ylabel is None:
-            left = (0.06 + extra) * default_width / self._width
+            left = (0.06 + extra) * width_factor
         else:
-            left = (0.09 + extra) * default_width / self._width
+            left = (0.09 + extra) * width_factor
 
-        right = 1 - (0.06 * default_width / self._width)
-        top = 1 - (0.15 * default_height / self._height)
-        bottom = 0.23 * default_height / self._height
+        right = 1 - 0.06 * width_factor
+        top = 1 - 0.15 * height_factor
+        bottom = 0.23 * height_factor
 
         # apply to the figure
         fig.subplots_adjust(left=left, right=right, top=top, bottom=bottom)
@@ -381,47 +468,84 @@ class Plotter(object):
 
         This function does nothing if `self._changed` is `False`.
         """
+        if self._batch_depth:
+            # inside `batch_updates`: render once when the outermost context exits
+            already_forced = self._deferred_plot is not None and self._deferred_plot[0]
+            self._deferred_plot = (force or already_forced, graph_output)
+            return
+
         if not self._changed and not force:
             return
 
-        # reset matplotlib backend. This is necessary if it was changed to a non-interactive one externally
-        for backend in ["module://ipykernel.pylab.backend_inline", "nbAgg", "Qt5Agg", "WXAgg"]:
-            try:
-                changed = plt.get_backend() != backend
-                plt.switch_backend(backend)
-                if changed:
+        # imported here rather than at module level so that loading the extension
+        # does not pay for pyplot backend setup or mpld3 until something is plotted
+        import matplotlib.pyplot as plt
+        import mpld3
+
+        from autoplot.plugins import InteractiveLegend, RangeSelectorButtons, SaveImageButtons, TimeSeriesTooltip
+
+        # reset matplotlib backend. This is necessary if it was changed to a non-interactive one externally.
+        # Skipped entirely when the current backend is already an acceptable one
+        backends = ["module://ipykernel.pylab.backend_inline", "nbAgg", "Qt5Agg", "WXAgg"]
+        if plt.get_backend() not in backends:
+            for backend in backends:
+                try:
+                    plt.switch_backend(backend)
                     self._toast.show(f"matplotlib backend switched to '{backend}'.", ToastType.warning)
-                break
-            except ImportError:
-                pass
+                    break
+                except ImportError:
+                    pass
+
+        if not self._mpld3_enabled:
+            mpld3.enable_notebook()
+            self._mpld3_enabled = True
+
+        # data-only changes reuse the cached figure: refresh the affected line
+        # data in place and re-display, skipping figure and plugin reconstruction.
+        # A data update can still change the plotted time span, in which case the
+        # range selector labels baked into the cached figure would be stale, so
+        # the fast path is only taken while the visible range is unchanged
+        if self._fig is not None and not self._dirty_structural and not self._range_labels_stale():
+            self._replot_series_data(graph_output)
+            return
 
-        mpld3.enable_notebook()
+        if self._fig is not None:
+            plt.close(self._fig)
 
         fig: plt.Figure
         ax: plt.Axes
         fig, ax = plt.subplots(figsize=(self._width, self._height))
 
+        # snapshot each visible trace once, collapsing the per-trace method calls
+        # of the old loop into a single dispatch
+        # membership in the maintained set replaces the per-trace is_visible call;
+        # iterating the trace dict keeps the insertion (legend / z) order stable
+        visible = [(name, tr.snapshot()) for name, tr in self._traces.items() if name in self._visible]
+        views = [view for _, view in visible]
+
         lines = []
         labels = []
-
-        # reset min and max x values
+        fig_lines = {}
+        for name, view in visible:
+            ax.add_line(view.line)
+            lines.append(view.line)
+            labels.append(view.label)
+            fig_lines[name] = view.line
+
+        # aggregate the x range and step as numpy reductions: the datetimes are
+        # packed into datetime64 arrays and reduced through their int64 view,
+        # rather than compared pairwise as Python objects
         x_min: OptDatetime = None
         x_max: OptDatetime = None
         min_step = 1e9  # arbitrarily large
-
-        # add lines
-        for name, tr in self._traces.items():
-            if tr.is_visible():
-                line = tr.get_line()
-                ax.add_line(line)
-
-                x0, x1 = tr.get_x_min_max()
-                x_min = x0 if x_min is None else min(x_min, x0)
-                x_max = x1 if x_max is None else max(x_max, x1)
-                min_step = min(min_step, tr.get_step_size())
-
-                lines.append(line)
-                labels.append(tr.get_label())
+        if views:
+            count = len(views)
+            starts = np.fromiter((view.x0 for view in views), dtype="datetime64[us]", count=count)
+            ends = np.fromiter((view.x1 for view in views), dtype="datetime64[us]", count=count)
+            steps = np.fromiter((view.step for view in views), dtype="float64", count=count)
+            x_min = starts.view("i8").min().astype("datetime64[us]").astype(object)
+            x_max = ends.view("i8").max().astype("datetime64[us]").astype(object)
+            min_step = steps.min()
 
         # configure layout
         ax.grid()
@@ -431,27 +555,40 @@ class Plotter(object):
         if self._ylabel is not None:
             ax.set_ylabel(self._ylabel, fontdict=dict(size=13), labelpad=25)
 
-        # add mpld3 plugins if plot is not empty
+        # add mpld3 plugins if plot is not empty, connected in one varargs call
         save_buttons = ["png", "svg"]
-        mpld3.plugins.connect(fig, SaveImageButtons(save_buttons))
+        if self._save_buttons_plugin is None:
+            self._save_buttons_plugin = SaveImageButtons(save_buttons)
+        plugins = [self._save_buttons_plugin]
 
         if len(lines) > 0:
-            mpld3.plugins.connect(fig, InteractiveLegend(lines, labels))
-            mpld3.plugins.connect(fig, TimeSeriesTooltip(lines))
-
             assert x_min is not None
             assert x_max is not None
             total_range = (x_max - x_min).total_seconds()
-            button_labels = gen_range_selector_labels(total_range, min_step, True)
+            cached_range, cached_step, cached_labels = self._range_label_cache
+            if cached_labels is not None and cached_range == total_range and cached_step == min_step:
+                button_labels = cached_labels
+            else:
+                button_labels = gen_range_selector_labels(total_range, min_step, True)
+                self._range_label_cache = (total_range, min_step, button_labels)
             margin_right = len(save_buttons) * 50
-            mpld3.plugins.connect(fig, RangeSelectorButtons(button_labels, lines, margin_right))
+            plugins += [
+                InteractiveLegend(lines, labels),
+                TimeSeriesTooltip(lines),
+                RangeSelectorButtons(button_labels, lines, margin_right),
+            ]
+
+        mpld3.plugins.connect(fig, *plugins)
 
         # fit to the data
         ax.autoscale(enable=True, axis="x", tight=True)
         ax.autoscale(enable=True, axis="y")
 
-        # adjust figure layout to ensure legend and hover info fit
-        y_max = max(abs(y_loc) for y_loc in plt.yticks()[0])
+        # adjust figure layout to ensure legend and hover info fit. ax.get_yticks
+        # returns just the tick array (plt.yticks also builds the labels), and the
+        # numpy reduction replaces a Python-level abs/max loop
+        ticks = ax.get_yticks()
+        y_max = float(np.abs(ticks).max()) if ticks.size else 0.0
         self._adjust_fig_margins(fig, y_max)
 
         # display plot in placeholder
@@ -459,8 +596,97 @@ class Plotter(object):
             clear_output()
             plt.show()
 
+        # keep the figure for data-only refreshes until the next structural change
+        self._fig = fig
+        self._ax = ax
+        self._fig_lines = fig_lines
+        self._dirty_structural = False
+        self._dirty_series.clear()
+        self._dirty_cosmetic.clear()
         self._changed = False
 
+    def _range_labels_stale(self) -> bool:
+        """Return `True` if a data update has invalidated the cached range labels.
+
+        The range selector presets depend only on the visible traces' total time
+        span and smallest step, memoised in `_range_label_cache` when the figure
+        was built. Recomputing the pair from the traces' own (also memoised)
+        endpoints is cheap, and a mismatch means the cached figure must be
+        rebuilt rather than refreshed in place.
+        """
+        cached_range, cached_step, _ = self._range_label_cache
+
+        x_min: OptDatetime = None
+        x_max: OptDatetime = None
+        min_step = 1e9  # arbitrarily large
+        for name in self._visible:
+            trace = self._traces[name]
+            x0, x1 = trace.get_x_min_max()
+            if x_min is None or x0 < x_min:
+                x_min = x0
+            if x_max is None or x1 > x_max:
+                x_max = x1
+            min_step = min(min_step, trace.get_step_size())
+
+        if x_min is None:
+            # nothing visible: there are no range buttons to go stale
+            return False
+
+        return (x_max - x_min).total_seconds() != cached_range or min_step != cached_step
+
+    def _replot_series_data(self, graph_output: widgets.Output):
+        """Re-render the cached figure, refreshing only the changed line data.
+
+        The traces' own lines are kept up to date by `Trace.update_series`, so the
+        copies living in the cached figure just need their data synced across.
+        """
+        for name in self._dirty_series:
+            line = self._fig_lines.get(name)
+            tr = self._traces.get(name)
+            if line is not None and tr is not None:
+                x_data, y_data = tr.get_line_data()
+                line.set_data(x_data, y_data)
+
+        for name in self._dirty_cosmetic:
+            line = self._fig_lines.get(name)
+            tr = self._traces.get(name)
+            if line is not None and tr is not None:
+                line.set_color(tr.get_colour())
+
+        # fit to the new data
+        self._ax.relim()
+        self._ax.autoscale_view()
+
+        # the margins depend on the widest y tick label, which the new data may
+        # have changed
+        ticks = self._ax.get_yticks()
+        y_max = float(np.abs(ticks).max()) if ticks.size else 0.0
+        self._adjust_fig_margins(self._fig, y_max)
+
+        with graph_output:
+            clear_output()
+            display(self._fig)
+
+        self._dirty_series.clear()
+        self._dirty_cosmetic.clear()
+        self._changed = False
+
+
+def _var_fingerprint(var: Union[pd.DataFrame, pd.Series]) -> Tuple:
+    """Return a cheap structural fingerprint of a pandas variable.
+
+    Used to detect in-place modifications (e.g. added or dropped columns) of an
+    object that keeps its identity between cell executions.
+    """
+    if isinstance(var, pd.DataFrame):
+        return (var.shape, tuple(var.columns), id(var.index))
+
+    if isinstance(var, pd.Series):
+        return (len(var), id(var.index))
+
+    # not a pandas object (e.g. a reassigned variable of another type)
+    return ()
+
 
 class PlotterModel(View):
     """Class defining handlers for IPython events.
@@ -473,6 +699,10 @@ class PlotterModel(View):
         Return the dictionary of series names associated with each dataframe.
     """
 
+    # these attributes are hit many times per cell execution; slots make the
+    # lookups direct rather than going through the instance dict
+    __slots__ = ("_plotter", "_series_dict", "_plotted_dfs", "_ns_with_series", "_dispatch", "_last_seen")
+
     def __init__(self, plotter: Plotter):
         """Initialise a `CellEventHandler` instance.
 
@@ -495,6 +725,21 @@ class PlotterModel(View):
         # set of variables in namespace, including series extracted from data frames
         self._ns_with_series: Set[str] = set()
 
+        # handlers keyed on exact variable type, to avoid repeated isinstance checks
+        # per variable per cell. Subclasses are resolved once and memoized
+        self._dispatch: Dict[type, Optional[Callable[[str, Any], bool]]] = {
+            pd.Series: self._add_trace_for_series,
+            pd.DataFrame: self._add_traces_for_dataframe,
+        }
+
+        # weak reference to the variable object and structural fingerprint last
+        # handled for each name. Namespace variables that are still the same,
+        # structurally unchanged object as last time are skipped entirely, so
+        # per-cell cost scales with the number of changed variables rather than the
+        # namespace size. Weak references mean deleted variables are not kept alive,
+        # and a recycled id can never masquerade as an unchanged object
+        self._last_seen: Dict[str, Tuple["weakref.ref", Tuple]] = {}
+
     def __getitem__(self, item: str) -> Union[Set[str], pd.Series]:
         try:
             return self._plotted_dfs[item]
@@ -534,18 +779,16 @@ class PlotterModel(View):
         """
         # update the dataframe dictionary
         if df_name is not None:
-            try:
-                self[df_name].add(name)
-            except KeyError:
-                self[df_name] = {name}
+            self._plotted_dfs.setdefault(df_name, set()).add(name)
 
-        # update it if exists and was modified
-        if name in self._series_dict:
-            self[name] = series
+        # a single membership check and store; update the trace if the series
+        # already existed, otherwise add it
+        existing = name in self._series_dict
+        self._series_dict[name] = series
+
+        if existing:
             self._plotter.update_trace_series(name, series)
-        # add it if new
         else:
-            self[name] = series
             self._plotter.add_trace(name, series, df_name)
 
     def _delete_trace(self, name: str):
@@ -554,12 +797,18 @@ class PlotterModel(View):
         Also removes the variable name (and column names, if applicable) from the
         relevant sets / dictionaries.
         """
-        if name in self._plotted_dfs:
-            for series_name in self._plotted_dfs[name]:
+        columns = self._plotted_dfs.pop(name, None)
+
+        if columns is not None:
+            for series_name in columns:
                 self._plotter.hide_trace(series_name)
-                self._series_dict.pop(series_name)
 
-            self._plotted_dfs.pop(name)
+            if len(columns) > 50:
+                # for wide dataframes one C-level dict rebuild beats per-key pops
+                self._series_dict = {k: v for k, v in self._series_dict.items() if k not in columns}
+            else:
+                for series_name in columns:
+                    self._series_dict.pop(series_name)
         else:
             self._plotter.hide_trace(name)
             self._series_dict.pop(name)
@@ -567,11 +816,12 @@ class PlotterModel(View):
             # if it is a dataframe column, remove its reference from self._plotted_dfs
             df_name = self._plotter[name].df_name
             if df_name is not None:
-                self._plotted_dfs[df_name].remove(name)
+                siblings = self._plotted_dfs[df_name]
+                siblings.remove(name)
 
                 # remove the dataframe set if empty
-                if len(self._plotted_dfs[df_name]) == 0:
-                    self._plotted_dfs.pop(df_name)
+                if not siblings:
+                    del self._plotted_dfs[df_name]
 
     def _add_trace_for_series(self, name: str, var: Any) -> bool:
         """Plot variable if it is of type pd.Series and is plottable.
@@ -624,14 +874,26 @@ class PlotterModel(View):
         if name in self._series_dict:
             self._delete_trace(name)
 
-        columns = {col: var[col] for col in var.columns}
+        # the index is shared by all columns, so check it once. Columns with a
+        # non-numeric dtype can never be plotted, so filter them in a single pass
+        # rather than materialising and scanning every column
+        if isinstance(var.index, pd.DatetimeIndex):
+            plottable_cols = set(var.select_dtypes(include="number").columns)
+        else:
+            plottable_cols = set()
+
+        # hoist the method lookup out of the per-column loop
+        format_series_name = DF_COLUMN_FORMAT_STRING.format
 
-        for col, series in columns.items():
-            series_name = DF_COLUMN_FORMAT_STRING.format(name, col)
+        for col in var.columns:
+            series_name = format_series_name(name, col)
             self._ns_with_series.add(series_name)
 
+            # materialise the column once, and only for candidate columns
+            series = var[col] if col in plottable_cols else None
+
             # plot column if plottable
-            if is_plottable(series):
+            if series is not None and is_plottable(series):
                 self._update_trace_if_changed(series_name, series, name)
             # delete columns that used to be plottable
             elif series_name in self._series_dict:
@@ -651,28 +913,57 @@ class PlotterModel(View):
         for name, var in pandas_vars.items():
             self._ns_with_series.add(name)
 
-            # plot variables of type pd.Series (if plottable)
-            if self._add_trace_for_series(name, var):
+            # skip variables that are still the same object as last cell and have not
+            # changed shape; their traces are already up to date
+            fingerprint = _var_fingerprint(var)
+            entry = self._last_seen.get(name)
+            if entry is not None and entry[0]() is var and entry[1] == fingerprint:
+                if name in self._plotted_dfs:
+                    self._ns_with_series.update(self._plotted_dfs[name])
                 continue
 
-            # convert and store variables of type pd.Dataframe
-            if self._add_traces_for_dataframe(name, var):
+            try:
+                self._last_seen[name] = (weakref.ref(var), fingerprint)
+            except TypeError:
+                # type does not support weak references; always take the slow path
+                self._last_seen.pop(name, None)
+
+            # plot series (if plottable) and dataframes via the type-keyed handlers
+            try:
+                handler = self._dispatch[type(var)]
+            except KeyError:
+                # resolve subclasses of pd.Series / pd.DataFrame once per type
+                if isinstance(var, pd.Series):
+                    handler = self._add_trace_for_series
+                elif isinstance(var, pd.DataFrame):
+                    handler = self._add_traces_for_dataframe
+                else:
+                    handler = None
+                self._dispatch[type(var)] = handler
+
+            if handler is not None and handler(name, var):
                 continue
 
             # variable that used to be a plottable series or dataframe
             if name in self._series_dict or name in self._plotted_dfs:
                 self._delete_trace(name)
 
+        # forget variables that have left the namespace
+        for name in set(self._last_seen.keys()) - set(pandas_vars.keys()):
+            del self._last_seen[name]
+
     def _hide_traces_for_deleted_vars(self):
         """Hide the traces of deleted variables, unless they were forcibly shown."""
-        deleted_names = self._plotter.get_visible() - self._ns_with_series - self._plotter.force_shown
+        # single-pass difference, avoiding the intermediate set a chained `-` builds
+        deleted_names = self._plotter.get_visible().difference(self._ns_with_series, self._plotter.force_shown)
 
         for name in deleted_names:
             self._delete_trace(name)
 
     def update_variables(self, pandas_vars: Dict[str, Union[pd.DataFrame, pd.Series]]) -> None:
-        self._add_traces_for_namespace_vars(pandas_vars)
-        self._hide_traces_for_deleted_vars()
+        with self._plotter.batch_updates():
+            self._add_traces_for_namespace_vars(pandas_vars)
+            self._hide_traces_for_deleted_vars()
 
     def draw(self, force, graph_output):
         self._plotter.plot(force, graph_output)
@@ -682,8 +973,9 @@ class PlotterModel(View):
 
         try:
             # hide all associated traces if dataframe name given
-            if var_name in self._plotted_dfs:
-                for trace_name in self._plotted_dfs[var_name]:
+            df_columns = self._plotted_dfs.get(var_name)
+            if df_columns is not None:
+                for trace_name in df_columns:
                     self._plotter.hide_trace(trace_name)
             # otherwise hide named trace
             else:
@@ -697,8 +989,9 @@ class PlotterModel(View):
 
         try:
             # show all associated traces if dataframe name given
-            if var_name in self._plotted_dfs:
-                for trace_name in self._plotted_dfs[var_name]:
+            df_columns = self._plotted_dfs.get(var_name)
+            if df_columns is not None:
+                for trace_name in df_columns:
                     self._plotter.force_show_trace(trace_name)
             # otherwise show named trace
             else:
@@ -722,8 +1015,9 @@ class PlotterModel(View):
 
         try:
             # rename all associated traces if dataframe name given
-            if var_name in self._plotted_dfs:
-                for trace_name in self._plotted_dfs[var_name]:
+            df_columns = self._plotted_dfs.get(var_name)
+            if df_columns is not None:
+                for trace_name in df_columns:
                     label = trace_name.replace(var_name, display_name)
                     self._plotter.update_trace_label(trace_name, label)
             # otherwise update label of named trace
@@ -734,22 +1028,22 @@ class PlotterModel(View):
             toast.unrecognised_variable(var_name)
 
     def set_plot_width(self, toast: Toast, width: int) -> None:
-        if width < FigSize.MIN_WIDTH.value:
-            toast.show(f"Figure width cannot be less than {FigSize.MIN_WIDTH.value}", ToastType.info)
-            width = FigSize.MIN_WIDTH.value
-        elif width > FigSize.MAX_WIDTH.value:
-            toast.show(f"Figure width cannot be greater than {FigSize.MAX_WIDTH.value}", ToastType.info)
-            width = FigSize.MAX_WIDTH.value
+        if width < FigSize.MIN_WIDTH:
+            toast.show(f"Figure width cannot be less than {FigSize.MIN_WIDTH}", ToastType.info)
+            width = FigSize.MIN_WIDTH
+        elif width > FigSize.MAX_WIDTH:
+            toast.show(f"Figure width cannot be greater than {FigSize.MAX_WIDTH}", ToastType.info)
+            width = FigSize.MAX_WIDTH
 
         self._plotter.set_figure_width(width)
 
     def set_plot_height(self, toast: Toast, height: int) -> None:
-        if height < FigSize.MIN_HEIGHT.value:
-            toast.show(f"Figure height cannot be less than {FigSize.MIN_HEIGHT.value}", ToastType.info)
-            height = FigSize.MIN_HEIGHT.value
-        elif height > FigSize.MAX_HEIGHT.value:
-            toast.show(f"Figure height cannot be greater than {FigSize.MAX_HEIGHT.value}", ToastType.info)
-            height = FigSize.MAX_HEIGHT.value
+        if height < FigSize.MIN_HEIGHT:
+            toast.show(f"Figure height cannot be less than {FigSize.MIN_HEIGHT}", ToastType.info)
+            height = FigSize.MIN_HEIGHT
+        elif height > FigSize.MAX_HEIGHT:
+            toast.show(f"Figure height cannot be greater than {FigSize.MAX_HEIGHT}", ToastType.info)
+            height = FigSize.MAX_HEIGHT
 
         self._plotter.set_figure_height(height)
 
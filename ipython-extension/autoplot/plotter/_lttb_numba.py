@@ -0,0 +1,85 @@
+"""Module containing an optional numba-compiled LTTB downsampling kernel.
+
+Methods
+-------
+lttb_indices(x, y, n_out)
+    Return the indices of the `n_out` points selected by the LTTB algorithm.
+    `None` when numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return the indices of the `n_out` points selected by the LTTB algorithm.
+
+    LTTB (largest triangle, three buckets) keeps the first and last points and,
+    for each of the `n_out - 2` buckets in between, the point forming the
+    largest triangle with the previously selected point and the average of the
+    next bucket. The loop is plain scalar arithmetic, which is what numba
+    compiles well.
+
+    Parameters
+    ----------
+    x: np.ndarray
+        The x values, as int64 (e.g. a DatetimeIndex viewed as "i8").
+
+    y: np.ndarray
+        The y values, as float64. Must have the same length as `x`.
+
+    n_out: int
+        The number of points to select. Must be > 2 and < len(x).
+    """
+    n = x.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+
+    every = (n - 2) / (n_out - 2)
+    a = 0
+
+    for i in range(n_out - 2):
+        start = int(every * i) + 1
+        end = int(every * (i + 1)) + 1
+
+        # average of the following bucket, clamped to the end of the data
+        next_end = int(every * (i + 2)) + 1
+        if next_end > n:
+            next_end = n
+
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(end, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = next_end - end
+        if count > 0:
+            avg_x /= count
+            avg_y /= count
+
+        # pick the point forming the largest triangle with the previous
+        # selection and the next bucket's average
+        a_x = float(x[a])
+        a_y = y[a]
+        max_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((a_x - avg_x) * (y[j] - a_y) - (a_x - float(x[j])) * (avg_y - a_y))
+            if area > max_area:
+                max_area = area
+                best = j
+
+        out[i + 1] = best
+        a = best
+
+    return out
+
+
+# compiled lazily on first call; cache=True persists the machine code across
+# sessions so the compilation cost is only ever paid once per environment
+lttb_indices = njit(cache=True)(_lttb_indices) if njit is not None else None
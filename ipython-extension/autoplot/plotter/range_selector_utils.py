@@ -8,6 +8,8 @@ gen_range_selector_labels(total_range, min_diff, include_standard)
 
 from typing import List, Tuple
 
+import numpy as np
+
 # list of possible button labels, a selection of which will be chosen
 _LABELS: List[Tuple[float, str]] = []
 
@@ -18,6 +20,11 @@ _LABELS += [(n, f"{n}d") for n in [1, 5, 7]]  # days
 _LABELS += [(n * 30.5, f"{n}m") for n in [1, 3, 6]]  # months
 _LABELS += [(n * 365.25, f"{n}y") for n in [1, 2, 5]]  # years
 
+# the widths as a sorted array and the names alongside, so the label selection
+# below can binary-search instead of scanning the tuples in Python
+_WIDTHS = np.array([width for width, _ in _LABELS])
+_NAMES = [name for _, name in _LABELS]
+
 
 def gen_range_selector_labels(total_range: float, min_diff: float, include_standard: bool = True):
     """Return a list of range selector button labels, based on the given information.
@@ -46,27 +53,19 @@ def gen_range_selector_labels(total_range: float, min_diff: float, include_stand
     """
     n = len(_LABELS)
     # get index of first button that shows at least 10 min diff data points. Note that
-    # the maximum value is n - 2
+    # the maximum value is n - 2. The widths are sorted, so searchsorted finds the
+    # first one strictly greater than the target
     min_diff_10 = min_diff / 86400 * 10  # convert to days
-    first = n - 2
+    first = min(int(np.searchsorted(_WIDTHS[:-1], min_diff_10, side="right")), n - 2)
 
-    for i, (width, _) in enumerate(_LABELS[:-1]):
-        if width > min_diff_10:
-            first = i
-            break
-
-    # get index of the last button that is at least double the data range. Note that
-    # the minimum value is first + 1
+    # get index of the last button that is at least double the data range. If no later
+    # width exceeds the target, searchsorted returns the slice length, which lands on
+    # n - 1 as before
     total_range_2 = total_range / 86400 * 2  # convert to days
-    last = n - 1
-
-    for i, (width, _) in enumerate(_LABELS[first + 1 :]):
-        if width > total_range_2:
-            last = first + i
-            break
+    last = first + int(np.searchsorted(_WIDTHS[first + 1 :], total_range_2, side="right"))
 
     # get evenly spaced selection of labels between first and last indices
-    labels = [_LABELS[i][1] for i in range(first, last + 1)]
+    labels = _NAMES[first : last + 1]
 
     # add special buttons
     if labels[-1][-1] in {"m", "y"}:
@@ -6,9 +6,8 @@ Trace
     Class to store a `Line2D` instance, and manage how it is displayed and updated.
 """
 
-import copy
 import datetime
-from typing import Optional, Tuple
+from typing import NamedTuple, Optional, Tuple
 
 import matplotlib.lines as mpl_lines
 import numpy as np
@@ -16,6 +15,56 @@ import pandas as pd
 from matplotlib.colors import is_color_like
 
 from autoplot.extensions.toast import Toast
+from autoplot.plotter._lttb_numba import lttb_indices as _lttb_indices
+
+# optional outlier-preserving downsampler. When tsdownsample is available its
+# MinMaxLTTB algorithm picks the visually significant points; failing that a
+# numba-compiled LTTB kernel is tried, and finally traces fall back to plain
+# evenly-spaced decimation
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+
+    _LTTB_DOWNSAMPLER = MinMaxLTTBDownsampler()
+except ImportError:
+    _LTTB_DOWNSAMPLER = None
+
+
+def _arrays_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Return `True` if the two arrays hold the same values.
+
+    The identity and shared-buffer checks settle the common "unchanged
+    variable" cases in O(1); only genuinely different arrays pay for the
+    element-wise comparison.
+    """
+    if a is b:
+        return True
+
+    if a.shape != b.shape:
+        return False
+
+    # two views over the same memory with matching layout hold the same values.
+    # `Series.values` can be an extension array (e.g. for nullable dtypes),
+    # which exposes no buffer attributes, so only plain ndarrays take this path
+    if (
+        isinstance(a, np.ndarray)
+        and isinstance(b, np.ndarray)
+        and a.dtype == b.dtype
+        and a.strides == b.strides
+        and a.ctypes.data == b.ctypes.data
+    ):
+        return True
+
+    return np.array_equal(a, b)
+
+
+class TraceView(NamedTuple):
+    """Snapshot of a trace's renderable state, taken once per plot."""
+
+    line: mpl_lines.Line2D
+    x0: datetime.datetime
+    x1: datetime.datetime
+    step: float
+    label: str
 
 
 class Trace(object):
@@ -48,7 +97,7 @@ class Trace(object):
         Return the min and max x values as datetime objects.
 
     get_line()
-        Return a copy of the trace's `Line2D` instance.
+        Return a new `Line2D` instance sharing the trace's data arrays.
 
     get_step_size()
         Return the approximate index step size, in seconds.
@@ -108,6 +157,18 @@ class Trace(object):
         # the approximate index step size, in seconds
         self._step_size = 1
 
+        # memo of the last `_get_downsampled` result. Holding the source series
+        # object (rather than its id) keeps the key valid for as long as the
+        # entry can be returned
+        self._ds_series: Optional[pd.Series] = None
+        self._ds_max_length: Optional[int] = None
+        self._ds_result: Optional[pd.Series] = None
+
+        # memo of `get_x_min_max`, keyed on the (immutable) index object it was
+        # computed from
+        self._x_min_max_index: Optional[pd.Index] = None
+        self._x_min_max: Optional[Tuple[datetime.datetime, datetime.datetime]] = None
+
         # build the line
         self._line: mpl_lines.Line2D
         self._build_line_with_props()
@@ -118,29 +179,56 @@ class Trace(object):
         `downsample_warning_toast()` will be called if the user has not already been
         warned that the series has been downsampled.
         """
+        # reuse the previous result while the series object and maximum length
+        # are unchanged, e.g. when only the other axis of the line is rebuilt
+        if self._ds_result is not None and self._ds_series is self._series and self._ds_max_length == self._max_length:
+            return self._ds_result
+
         length = len(self._series)
 
         # downsample the series if it is too long
         if self._max_length < length:
-            index = np.round(np.linspace(0, length - 1, self._max_length)).astype(int)
+            if _LTTB_DOWNSAMPLER is not None:
+                index = _LTTB_DOWNSAMPLER.downsample(
+                    self._series.index.values.view("i8"), self._series.values, n_out=self._max_length
+                )
+            elif _lttb_indices is not None and self._max_length > 2:
+                index = _lttb_indices(
+                    self._series.index.values.view("i8"),
+                    np.asarray(self._series.values, dtype=np.float64),
+                    self._max_length,
+                )
+            else:
+                index = np.round(np.linspace(0, length - 1, self._max_length)).astype(int)
 
             # warn user if have not already done so
             if not self._been_warned:
                 self._toast.downsample_warning(self._name, length, self._max_length)
                 self._been_warned = True
 
-            return self._series[index]
+            # positional selection: Series.take is a single C-level take on the
+            # values and index, bypassing __getitem__'s label-vs-position dispatch
+            result = self._series.take(index)
+        else:
+            # reset the warning flag, as from now the series will be displayed in full
+            self._been_warned = False
+            result = self._series
 
-        # reset the warning flag, as from now the series will be displayed in full
-        self._been_warned = False
-        return self._series
+        self._ds_series = self._series
+        self._ds_max_length = self._max_length
+        self._ds_result = result
+        return result
 
     def _build_line_with_props(self):
         """Build the `Line2D` instance and calculate the step size."""
         series = self._get_downsampled()
         self._step_size = (series.index[1] - series.index[0]).total_seconds()
 
-        self._line = mpl_lines.Line2D(series.index, series.values, label=self._label, color=self._colour)
+        # hand matplotlib the underlying datetime64 array rather than the
+        # DatetimeIndex: the date conversion then runs as one vectorised
+        # operation instead of per-Timestamp, while keeping the date units
+        # (tick locators / formatters) intact
+        self._line = mpl_lines.Line2D(series.index.values, series.values, label=self._label, color=self._colour)
 
     def update_series(self, series: pd.Series) -> bool:
         """Update the trace with the given series. Return `True` if it was changed.
@@ -156,8 +244,15 @@ class Trace(object):
             True if the series was updated (i.e. the new series was different to
             the current one), otherwise False.
         """
-        index_equal = series.index.equals(self._series.index)
-        values_equal = np.array_equal(series.values, self._series.values)
+        # rerunning a cell usually rebinds the very same objects, so settle the
+        # common no-op case without touching any data
+        if series is self._series:
+            return False
+
+        index_equal = series.index is self._series.index or _arrays_equal(
+            series.index.values, self._series.index.values
+        )
+        values_equal = _arrays_equal(series.values, self._series.values)
 
         # do nothing if equal
         if index_equal and values_equal:
@@ -170,7 +265,7 @@ class Trace(object):
             self._line.set_ydata(self._get_downsampled().values)
         # update x data if y unchanged. Must downsample again to match original
         elif values_equal:
-            self._line.set_xdata(self._get_downsampled().index)
+            self._line.set_xdata(self._get_downsampled().index.values)
         else:
             self._build_line_with_props()
 
@@ -268,6 +363,10 @@ class Trace(object):
         """Return the trace label, as it should appear in the legend."""
         return self._label
 
+    def get_colour(self) -> str:
+        """Return the trace colour."""
+        return self._colour
+
     def update_visible(self, visible: bool) -> bool:
         """Update the trace visibility. Return `True` if it was changed.
 
@@ -294,11 +393,26 @@ class Trace(object):
 
     def get_x_min_max(self) -> Tuple[datetime.datetime, datetime.datetime]:
         """Return the min and max x values as datetime objects."""
-        return self._series.index.min().to_pydatetime(), self._series.index.max().to_pydatetime()
+        index = self._series.index
+        if self._x_min_max is None or self._x_min_max_index is not index:
+            # the common monotonic case reads the endpoints directly; otherwise
+            # fall back to the C-level reductions
+            if index.is_monotonic_increasing:
+                x_min, x_max = index[0], index[-1]
+            else:
+                x_min, x_max = index.min(), index.max()
+            self._x_min_max = (x_min.to_pydatetime(), x_max.to_pydatetime())
+            self._x_min_max_index = index
+        return self._x_min_max
 
     def get_line(self) -> mpl_lines.Line2D:
-        """Return a copy of the trace's `Line2D` instance."""
-        return copy.copy(self._line)
+        """Return a fresh `Line2D` instance sharing the trace's data arrays."""
+        # Line2D stores references, so this copies no data, unlike copy.copy of
+        # the existing line which also clones its transform / path bookkeeping.
+        # A new instance per call keeps each figure's line independent
+        return mpl_lines.Line2D(
+            self._line.get_xdata(orig=True), self._line.get_ydata(orig=True), label=self._label, color=self._colour
+        )
 
     def get_step_size(self) -> float:
         """Return the approximate index step size, in seconds.
@@ -307,3 +421,12 @@ class Trace(object):
         between the first and second index values of the downsampled series.
         """
         return self._step_size
+
+    def snapshot(self) -> TraceView:
+        """Return a `TraceView` of everything the plot loop needs in one call."""
+        x0, x1 = self.get_x_min_max()
+        return TraceView(self.get_line(), x0, x1, self._step_size, self._label)
+
+    def get_line_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the x and y data currently set on the trace's line."""
+        return self._line.get_xdata(), self._line.get_ydata()
@@ -0,0 +1,71 @@
+"""Module containing the lazy loader for the plugins' JavaScript bundles.
+
+Classes
+-------
+LazyJS
+    Descriptor that reads a plugin's JS bundle from disk on first access.
+
+Methods
+-------
+load_js(path)
+    Return the contents of the JS bundle at `path`, reading it at most once.
+"""
+
+import functools
+from typing import Optional
+
+try:
+    from importlib.resources import files as _resource_files
+except ImportError:  # Python < 3.9
+    _resource_files = None
+
+
+@functools.lru_cache(maxsize=None)
+def load_js(relative_path: str) -> str:
+    """Return the contents of the JS bundle at `relative_path`, read at most once.
+
+    The cache is keyed on the package-relative path and lives on this module,
+    so reloading the plugin modules (e.g. via `%reload_ext autoplot`) rebuilds
+    their descriptors without rereading unchanged bundles from disk.
+
+    Resources are resolved through `importlib.resources`, avoiding the
+    pkg_resources import and its start-up cost; older interpreters fall back
+    to pkg_resources.
+    """
+    if _resource_files is not None:
+        resource = _resource_files(__package__)
+        for part in relative_path.split("/"):
+            resource = resource.joinpath(part)
+        return resource.read_text(encoding="utf-8")
+
+    from pkg_resources import resource_filename
+
+    with open(resource_filename(__package__, relative_path), "r") as f:
+        return f.read()
+
+
+class LazyJS(object):
+    """Descriptor that reads a plugin's JS bundle from disk on first access.
+
+    The plugin modules are all imported when the extension loads, but their
+    bundles are only needed once a figure is actually rendered, so both the
+    resource lookup and the disk read are deferred until then, and done at
+    most once per bundle.
+    """
+
+    def __init__(self, relative_path: str):
+        """Initialise a `LazyJS` instance.
+
+        Parameters
+        ----------
+        relative_path: str
+            Path of the JS bundle, relative to this package (e.g.
+            "bundles/interactiveLegend.js").
+        """
+        self._relative_path = relative_path
+        self._cache: Optional[str] = None
+
+    def __get__(self, instance, owner) -> str:
+        if self._cache is None:
+            self._cache = load_js(self._relative_path)
+        return self._cache
@@ -10,15 +10,10 @@ from typing import List
 
 import matplotlib.lines as mpl_lines
 import mpld3
-from pkg_resources import resource_filename
 
+from autoplot.plugins._js_loader import LazyJS
 from autoplot.plugins.line_utils import get_line_ids
 
-_js_file_path = resource_filename(__name__, "bundles/interactiveLegend.js")
-
-with open(_js_file_path, "r") as f:
-    _js = f.read()
-
 
 class InteractiveLegend(mpld3.plugins.PluginBase):
     """Class defining an mpld3 plugin to create an interactive legend.
@@ -55,7 +50,7 @@ class InteractiveLegend(mpld3.plugins.PluginBase):
     property `.isHidden`.
     """
 
-    JAVASCRIPT = _js
+    JAVASCRIPT = LazyJS("bundles/interactiveLegend.js")
     css_ = """.mpld3-interactive-legend-rect { cursor: pointer; }"""
 
     def __init__(
@@ -6,7 +6,7 @@ get_line_ids(lines)
     Return a list of mpld3 element ids corresponding to the given list of lines.
 """
 
-import collections
+from collections.abc import Iterable
 from typing import List
 
 from mpld3.utils import get_id
@@ -22,14 +22,36 @@ def get_line_ids(lines: List[mpl_lines.Line2D]) -> List[str]:
         List of matplotlib lines, generated using `ax.plot(...)`, `Line2D(...)` or
         equivalent.
     """
+    # the plotter hands over a flat list of Line2D instances, so resolve that
+    # case as a single comprehension allocated in one go. mpld3 memoizes the
+    # uuid per object itself; disabling the warning skips its per-call html-id
+    # regex check, which is redundant for the "el<pid><uuid>" ids it builds
+    if all(type(entry) is mpl_lines.Line2D for entry in lines):
+        return _dedupe([get_id(entry, warn_on_invalid=False) for entry in lines])
+
     line_ids: List[str] = []
 
     # because lines are built slightly differently depending on how they are defined,
-    # the exact type of the line must be checked before its id extracted
+    # the exact type of the line must be checked before its id extracted. The concrete
+    # list / tuple and Line2D checks come first: they cover every caller in practice
+    # and are much cheaper than the ABC isinstance, which is kept as the fallback
     for entry in lines:
-        if isinstance(entry, collections.Iterable):
-            line_ids += [get_id(line) for line in entry]
+        entry_type = type(entry)
+        if entry_type is list or entry_type is tuple:
+            line_ids.extend(get_id(line, warn_on_invalid=False) for line in entry)
+        elif entry_type is mpl_lines.Line2D or not isinstance(entry, Iterable):
+            line_ids.append(get_id(entry, warn_on_invalid=False))
         else:
-            line_ids.append(get_id(entry))
+            line_ids.extend(get_id(line, warn_on_invalid=False) for line in entry)
+
+    return _dedupe(line_ids)
+
 
-    return line_ids
+def _dedupe(line_ids: List[str]) -> List[str]:
+    """Return the ids with duplicates dropped, keeping the first-seen order.
+
+    The same line can appear more than once when callers mix flat and nested
+    inputs; shipping it once keeps the JSON payload and the per-element work in
+    the JavaScript plugins minimal.
+    """
+    return list(dict.fromkeys(line_ids))
@@ -6,18 +6,20 @@ RangeSelectorButtons
     Class defining an mpld3 plugin to create range selector buttons.
 """
 
+import re
 from typing import List, Optional
 
 import matplotlib.lines as mpl_lines
 import mpld3
-from pkg_resources import resource_filename
 
+from autoplot.plugins._js_loader import LazyJS
 from autoplot.plugins.line_utils import get_line_ids
 
-_js_file_path = resource_filename(__name__, "bundles/rangeSelectorButtons.js")
+# "<number><unit>" labels, e.g. "10d" or "3m"; compiled once at module load
+_LABEL_PATTERN = re.compile(r"\d+[sMhdwmy]\Z")
 
-with open(_js_file_path, "r") as f:
-    _js = f.read()
+# the labels with no numeric component
+_SPECIAL_LABELS = frozenset({"ytd", "fit", "reset"})
 
 
 class RangeSelectorButtons(mpld3.plugins.PluginBase):
@@ -57,7 +59,7 @@ class RangeSelectorButtons(mpld3.plugins.PluginBase):
         property `.isHidden`.
     """
 
-    JAVASCRIPT = _js
+    JAVASCRIPT = LazyJS("bundles/rangeSelectorButtons.js")
     css_ = """.mpld3-range-selector-button-rect { cursor: pointer; }
               .mpld3-range-selector-button-text { cursor: pointer; }"""
 
@@ -93,17 +95,17 @@ class RangeSelectorButtons(mpld3.plugins.PluginBase):
             The font size of the button labels.
         """
         for label in button_labels:
-            try:
-                int(label[:-1])
-                assert label[-1] in {"s", "M", "h", "d", "w", "m", "y"}
-            except ValueError:
-                assert label in {"ytd", "fit", "reset"}
-
-                if label == "fit" and lines is None:
-                    raise ValueError("The 'fit' button requires the 'lines' argument to be defined.")
-            except AssertionError:
+            # the common numeric-unit labels match the precompiled pattern, so no
+            # exception machinery or per-label set construction is involved
+            if _LABEL_PATTERN.match(label):
+                continue
+
+            if label not in _SPECIAL_LABELS:
                 raise ValueError(f"Invalid range selector button label '{label}'")
 
+            if label == "fit" and lines is None:
+                raise ValueError("The 'fit' button requires the 'lines' argument to be defined.")
+
         self.dict_ = {
             "type": "range_selector_buttons",
             "button_labels": button_labels,
@@ -9,12 +9,11 @@ SaveImageButtons
 from typing import List
 
 import mpld3
-from pkg_resources import resource_filename
 
-_js_file_path = resource_filename(__name__, "bundles/saveImageButtons.js")
+from autoplot.plugins._js_loader import LazyJS
 
-with open(_js_file_path, "r") as f:
-    _js = f.read()
+# the supported image formats, shared by every instance
+_VALID_LABELS = frozenset({"png", "svg"})
 
 
 class SaveImageButtons(mpld3.plugins.PluginBase):
@@ -37,7 +36,7 @@ class SaveImageButtons(mpld3.plugins.PluginBase):
     or `TimeSeriesTooltip` plugins.
     """
 
-    JAVASCRIPT = _js
+    JAVASCRIPT = LazyJS("bundles/saveImageButtons.js")
     css_ = """.mpld3-save-button-rect { cursor: pointer; }
               .mpld3-save-button-text { cursor: pointer; }"""
 
@@ -54,7 +53,8 @@ class SaveImageButtons(mpld3.plugins.PluginBase):
             The font size of the button labels.
         """
         for label in button_labels:
-            if label.lower() not in {"png", "svg"}:
+            # skip the lowercasing for the already-lowercase common case
+            if label not in _VALID_LABELS and label.lower() not in _VALID_LABELS:
                 raise ValueError(f"Invalid save image button label '{label}'")
 
         self.dict_ = {"type": "save_image_buttons", "button_labels": button_labels, "fontsize": fontsize}
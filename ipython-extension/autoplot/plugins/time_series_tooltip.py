@@ -10,15 +10,10 @@ from typing import List
 
 import matplotlib.lines as mpl_lines
 import mpld3
-from pkg_resources import resource_filename
 
+from autoplot.plugins._js_loader import LazyJS
 from autoplot.plugins.line_utils import get_line_ids
 
-_js_file_path = resource_filename(__name__, "bundles/timeSeriesTooltip.js")
-
-with open(_js_file_path, "r") as f:
-    _js = f.read()
-
 
 class TimeSeriesTooltip(mpld3.plugins.PluginBase):
     """Class defining an mpld3 plugin to create time series line graph tooltips.
@@ -58,7 +53,7 @@ class TimeSeriesTooltip(mpld3.plugins.PluginBase):
     property `.isHidden`.
     """
 
-    JAVASCRIPT = _js
+    JAVASCRIPT = LazyJS("bundles/timeSeriesTooltip.js")
 
     def __init__(self, lines: List[mpl_lines.Line2D], fontsize: int = 12):
         """Initialise a `TimeSeriesTooltip` instance.
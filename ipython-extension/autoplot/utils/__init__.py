@@ -1,6 +1,10 @@
 """Module containing utility functions and constants."""
 
+_QUOTE_CHARS = ("'", '"')
+
 
 def remove_quotes(text: str) -> str:
     """Return the `text` with any surrounding quotes removed."""
-    return text[1:-1] if text[0] + text[-1] in {"''", '""'} else text
+    # comparing the end characters directly avoids building a throwaway 2-char
+    # string per call, and the length guard makes empty strings safe
+    return text[1:-1] if len(text) >= 2 and text[0] == text[-1] and text[0] in _QUOTE_CHARS else text
@@ -1,10 +1,13 @@
 """Constants used throughout the package."""
 
-from enum import Enum
 
+class FigSize(object):
+    """Class storing constants associated with the figure's size.
 
-class FigSize(Enum):
-    """Class storing constants associated with the figure's size."""
+    Plain class-level ints: the values are only ever used in numeric
+    comparisons and messages, so there is no enum machinery (or `.value`
+    unwrapping) on those paths.
+    """
 
     MIN_WIDTH = 6
     """Minimum width of the figure in inches."""
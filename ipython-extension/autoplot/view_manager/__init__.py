@@ -8,7 +8,8 @@ ViewManager
     Class that control multiple views and get them displayed
 """
 import abc
-from typing import Dict, Set, Union, List
+import ast
+from typing import Dict, FrozenSet, Optional, Set, Union, List
 
 import IPython
 import pandas as pd
@@ -17,8 +18,34 @@ from autoplot.extensions.toast import Toast, ToastType
 from autoplot.view_manager.variable_utils import is_plottable
 from autoplot.extensions.autoplot_display import AutoplotDisplay
 
+# checked with a single isinstance call: one C-level walk over both types
+# instead of two chained Python-level checks
+_PD_TYPES = (pd.DataFrame, pd.Series)
+
+# names never treated as user variables; shared by every manager instance.
+# Underscore-prefixed IPython internals are already rejected by the filter below
+_RESERVED_NAMES = frozenset({"In", "Out", "get_ipython", "exit", "quit", "pd"})
+
+# the facade methods `ViewManager` forwards to the active view, used to compute
+# each view's capability set up front
+_DELEGATED_METHODS = (
+    "ignore_variable",
+    "show_variable",
+    "change_colour",
+    "rename_variable",
+    "freeze",
+    "defrost",
+    "update_max_series_length",
+    "set_ylabel",
+    "set_plot_height",
+    "set_plot_width",
+)
+
 
 class View(metaclass=abc.ABCMeta):
+    # no attributes of its own; lets subclasses benefit from declaring __slots__
+    __slots__ = ()
+
     @abc.abstractmethod
     def update_variables(self, pandas_vars: Dict[str, Union[pd.Series, pd.DataFrame]]) -> None:
         """After each cell execution this function is executed. At this moment the view has the chance to calculate
@@ -93,6 +120,72 @@ class View(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
 
+# calls after which we can no longer tell which names a cell may have touched
+_DYNAMIC_NS_NAMES = frozenset({"exec", "eval", "globals", "vars", "locals", "get_ipython"})
+
+
+def _parse_cell(raw_cell: str) -> Optional[ast.Module]:
+    """Parse the cell source, returning `None` if it is not plain Python (e.g. magics)."""
+    try:
+        return ast.parse(raw_cell)
+    except (SyntaxError, ValueError):
+        return None
+
+
+# statements / expressions that can create, rebind or mutate namespace variables
+_MUTATING_NODES = (
+    ast.Assign,
+    ast.AugAssign,
+    ast.AnnAssign,
+    ast.NamedExpr,
+    ast.Delete,
+    ast.Import,
+    ast.ImportFrom,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Call,
+    ast.Await,
+    ast.Global,
+    ast.Nonlocal,
+)
+
+
+def _cell_is_pure_display(tree: ast.Module) -> bool:
+    """Return `True` if the cell can neither rebind nor mutate any variable.
+
+    Such cells (e.g. a bare `df` to display it) cannot change what should be drawn,
+    so the whole post-run update can be skipped. Any call is conservatively treated
+    as potentially mutating.
+    """
+    return not any(isinstance(node, _MUTATING_NODES) for node in ast.walk(tree))
+
+
+def _cell_candidate_names(tree: ast.Module) -> Optional[Set[str]]:
+    """Return the set of variable names the cell could have created or modified.
+
+    Any variable referenced in the cell (in any context) is a candidate, as are names
+    bound by imports and function / class definitions. Returns `None` if the cell
+    touches the namespace dynamically, in which case the caller must fall back to a
+    full namespace scan.
+    """
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id in _DYNAMIC_NS_NAMES:
+                return None
+            names.add(node.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    return None
+                names.add((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+
+    return names
+
+
 class ViewManager:
     """
     Keeps track of pandas dataframes and series. It takes a dictionary of listeners that will be notified of all
@@ -124,7 +217,19 @@ class ViewManager:
         self._views = views
 
         # set of names to be ignored. Not necessary but useful for debugging
-        self._reserved: Set[str] = {"In", "Out", "get_ipython", "exit", "quit", "pd"}
+        self._reserved: FrozenSet[str] = _RESERVED_NAMES
+
+        # snapshot of the pandas variables found by the previous redraw, reused when
+        # the executed cell tells us which names it could have touched
+        self._pandas_vars: Dict[str, Union[pd.Series, pd.DataFrame]] = {}
+
+        # which delegated methods each view overrides, computed once so the facade
+        # methods below can branch on membership instead of catching the base
+        # class's NotImplementedError on every unsupported call
+        self._caps: Dict[str, FrozenSet[str]] = {
+            name: frozenset(m for m in _DELEGATED_METHODS if getattr(type(view), m, None) is not getattr(View, m))
+            for name, view in views.items()
+        }
 
     @property
     def active(self) -> str:
@@ -145,11 +250,53 @@ class ViewManager:
     def view_names(self) -> List[str]:
         return list(self._views.keys())
 
-    def redraw(self) -> None:
-        pandas_vars: Dict[str, Union[pd.Series, pd.DataFrame]] = {}
-        for name, var in self._shell.user_ns.items():
-            if not name.startswith("_") and name not in self._reserved and self._is_pandas(var):
-                pandas_vars[name] = var
+    def redraw(self, raw_cell: Optional[str] = None) -> None:
+        """Update the active view from the namespace and draw it.
+
+        Parameters
+        ----------
+        raw_cell: str, optional
+            The source of the cell that has just executed. If given and parseable, only
+            the names referenced by the cell are re-checked against the namespace;
+            otherwise the full namespace is scanned.
+        """
+        tree = _parse_cell(raw_cell) if raw_cell is not None else None
+
+        # display-only cells (no assignments, imports, deletions or calls) cannot
+        # have changed anything, so skip the update entirely unless the active view
+        # itself changed and needs a forced draw
+        if tree is not None and not self._changed and _cell_is_pure_display(tree):
+            return
+
+        candidates = _cell_candidate_names(tree) if tree is not None else None
+
+        reserved = self._reserved
+
+        if candidates is None:
+            # full scan, filtered in a single comprehension with the cheapest checks
+            # first. `name[:1]` avoids a method call per variable, which adds up when
+            # the namespace is full of IPython's `_i1..._iN` history entries
+            pandas_vars: Dict[str, Union[pd.Series, pd.DataFrame]] = {
+                name: var
+                for name, var in self._shell.user_ns.items()
+                if name[:1] != "_" and name not in reserved and isinstance(var, _PD_TYPES)
+            }
+        else:
+            # only names the cell referenced can have changed; start from the previous
+            # snapshot and re-check just those
+            user_ns = self._shell.user_ns
+            missing = object()
+            pandas_vars = dict(self._pandas_vars)
+            for name in candidates:
+                if name[:1] == "_" or name in reserved:
+                    continue
+                var = user_ns.get(name, missing)
+                if var is not missing and isinstance(var, _PD_TYPES):
+                    pandas_vars[name] = var
+                else:
+                    pandas_vars.pop(name, None)
+
+        self._pandas_vars = pandas_vars
 
         self.active_view.update_variables(pandas_vars)
         self.active_view.draw(self._changed, self._output)
@@ -169,10 +316,9 @@ class ViewManager:
             Name of the variable to hide, as it is defined in Python. Can be a series
             names or dataframe name.
         """
-        try:
+        if "ignore_variable" in self._caps[self._active]:
             return self.active_view.ignore_variable(toast, var_name)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement ignoring variables", ToastType.warning)
+        toast.show(f"{self._active} does not implement ignoring variables", ToastType.warning)
 
     def show_variable(self, toast: Toast, var_name: str) -> None:
         """Show the given variable on the plot. Undoes `ignore_variable`.
@@ -191,10 +337,9 @@ class ViewManager:
             Name of the variable to show, as it is defined in Python. Can be a series
             names or dataframe name.
         """
-        try:
+        if "show_variable" in self._caps[self._active]:
             return self.active_view.show_variable(toast, var_name)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement showing variables", ToastType.warning)
+        toast.show(f"{self._active} does not implement showing variables", ToastType.warning)
 
     def change_colour(self, toast: Toast, var_name: str, colour: str) -> None:
         """Update the colour of the given variable.
@@ -212,10 +357,9 @@ class ViewManager:
         colour: str
             The desired trace colour. Must be a valid matplotlib colour.
         """
-        try:
+        if "change_colour" in self._caps[self._active]:
             return self.active_view.change_colour(toast, var_name, colour)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement changing colours", ToastType.warning)
+        toast.show(f"{self._active} does not implement changing colours", ToastType.warning)
 
     def rename_variable(self, toast: Toast, var_name: str, display_name: str) -> None:
         """Update the legend label of the given variable.
@@ -235,27 +379,24 @@ class ViewManager:
         display_name: str
             The desired legend label.
         """
-        try:
+        if "rename_variable" in self._caps[self._active]:
             return self.active_view.rename_variable(toast, var_name, display_name)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement variable renaming", ToastType.warning)
+        toast.show(f"{self._active} does not implement variable renaming", ToastType.warning)
 
     def freeze(self, toast: Toast) -> None:
         """Set the plotter to frozen, preventing new traces from being added."""
-        try:
+        if "freeze" in self._caps[self._active]:
             return self.active_view.freeze(toast)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement freeze", ToastType.warning)
+        toast.show(f"{self._active} does not implement freeze", ToastType.warning)
 
     def defrost(self, toast: Toast) -> None:
         """Set the plotter to un-frozen, allowing new traces to be plotted.
 
         Note that traces defined while it was frozen will need to be added manually.
         """
-        try:
+        if "defrost" in self._caps[self._active]:
             return self.active_view.defrost(toast)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement defrost", ToastType.warning)
+        toast.show(f"{self._active} does not implement defrost", ToastType.warning)
 
     def update_max_series_length(self, toast: Toast, sample: int) -> None:
         """Update the maximum series length of all traces.
@@ -267,10 +408,9 @@ class ViewManager:
         max_length: int
             The new maximum series length. If 0, the traces will not be downsampled.
         """
-        try:
+        if "update_max_series_length" in self._caps[self._active]:
             return self.active_view.update_max_series_length(toast, sample)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement max series length", ToastType.warning)
+        toast.show(f"{self._active} does not implement max series length", ToastType.warning)
 
     def set_ylabel(self, toast: Toast, ylabel: str) -> None:
         """Set the y axis label.
@@ -285,10 +425,9 @@ class ViewManager:
         ylabel: str
             New label for the y axis. If it is an empty string, no label will be used.
         """
-        try:
+        if "set_ylabel" in self._caps[self._active]:
             return self.active_view.set_ylabel(toast, ylabel)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement changing ylabel", ToastType.warning)
+        toast.show(f"{self._active} does not implement changing ylabel", ToastType.warning)
 
     def set_plot_height(self, toast: Toast, height: int) -> None:
         """Validate and set the height of the figure.
@@ -302,10 +441,9 @@ class ViewManager:
             The desired height of the plot in inches. If outside the range `[_MIN_HEIGHT,
             _MAX_HEIGHT]`, will be set to the nearest limit and the user will be notified.
         """
-        try:
+        if "set_plot_height" in self._caps[self._active]:
             return self.active_view.set_plot_height(toast, height)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement setting the plot height", ToastType.warning)
+        toast.show(f"{self._active} does not implement setting the plot height", ToastType.warning)
 
     def set_plot_width(self, toast: Toast, width: int) -> None:
         """Validate and set the width of the figure.
@@ -319,10 +457,6 @@ class ViewManager:
             The desired width of the plot in inches. If outside the range `[_MIN_WIDTH,
             _MAX_WIDTH]`, will be set to the nearest limit and the user will be notified.
         """
-        try:
+        if "set_plot_width" in self._caps[self._active]:
             return self.active_view.set_plot_width(toast, width)
-        except NotImplementedError:
-            toast.show(f"{self._active} does not implement setting the plot height", ToastType.warning)
-
-    def _is_pandas(self, var):
-        return isinstance(var, pd.DataFrame) or isinstance(var, pd.Series)
+        toast.show(f"{self._active} does not implement setting the plot height", ToastType.warning)
@@ -6,11 +6,26 @@ is_plottable(series)
     Return `True` if the series is DateTime indexed and contains only numbers.
 """
 
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def _is_numeric(series: pd.Series) -> bool:
+# bounded cache of `is_plottable` results. `is_plottable` is called for every pandas
+# variable in the namespace on every cell execution, so caching avoids rescanning
+# large unchanged series. The key combines the series' identity with its length and
+# first / last index values, so a mutated or redefined series is re-checked.
+_PLOTTABLE_CACHE: Dict[Tuple, bool] = {}
+_PLOTTABLE_CACHE_MAX_SIZE = 512
+
+# cache of the datetime-index check keyed on index identity. Indices are typically
+# shared by all columns of a dataframe, so one check covers the lot. The concrete
+# index type is stored alongside the result to guard against recycled id()s
+_DT_INDEX_CACHE: Dict[int, Tuple[type, bool]] = {}
+_DT_INDEX_CACHE_MAX_SIZE = 512
+
+
+def _is_numeric(series: "pd.Series") -> bool:
     """Return `True` if the series contains only real numbers.
 
     Raises
@@ -19,10 +34,13 @@ def _is_numeric(series: pd.Series) -> bool:
         If the input variable does not have attribute `dtype`. Note that dataframes
         will raise an error.
     """
-    return np.issubdtype(series.dtype, np.number) and all(np.isreal(series))
+    # the dtype kind alone determines realness: ints, unsigned ints and floats are
+    # real; complex, bool, object / string and datetime kinds are not. This avoids
+    # scanning any values, and works for pandas extension dtypes too
+    return series.dtype.kind in "iuf"
 
 
-def _is_datetime_indexed(series: pd.Series) -> bool:
+def _is_datetime_indexed(series: "pd.Series") -> bool:
     """Return `True` if the series is datetime indexed.
 
     Raises
@@ -30,10 +48,40 @@ def _is_datetime_indexed(series: pd.Series) -> bool:
     AttributeError
         If the input variable does not have attribute `index`.
     """
-    return isinstance(series.index, pd.DatetimeIndex)
+    # imported here so that importing this module does not pull in pandas
+    import pandas as pd
+
+    index = series.index
+    cached = _DT_INDEX_CACHE.get(id(index))
+    if cached is not None and cached[0] is type(index):
+        return cached[1]
 
+    result = isinstance(index, pd.DatetimeIndex)
 
-def is_plottable(series: pd.Series) -> bool:
+    if len(_DT_INDEX_CACHE) >= _DT_INDEX_CACHE_MAX_SIZE:
+        _DT_INDEX_CACHE.clear()
+    _DT_INDEX_CACHE[id(index)] = (type(index), result)
+
+    return result
+
+
+def _plottable_cache_key(series: "pd.Series") -> Optional[Tuple]:
+    """Return the cache key for the series, or `None` if one cannot be built."""
+    try:
+        length = len(series)
+        index = series.index
+        # the dtype kind disambiguates a recycled id() whose index happens to match
+        kind = series.dtype.kind
+        key = (id(series), kind, length, index[0], index[-1]) if length else (id(series), kind, 0, None, None)
+        # the index endpoints may be unhashable (e.g. an object index holding
+        # ndarrays); such series must fall back to the uncached check
+        hash(key)
+        return key
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+
+def is_plottable(series: "pd.Series") -> bool:
     """Return `True` if the series can be plotted.
 
     This requires all of the following to be `True`:
@@ -41,8 +89,26 @@ def is_plottable(series: pd.Series) -> bool:
         - It is datetime indexed;
         - Its values are all real numbers;
         - Its length is greater than or equal to 2.
+
+    Results are cached, keyed on the series' identity, length and index endpoints.
     """
+    key = _plottable_cache_key(series)
+
+    if key is not None:
+        cached = _PLOTTABLE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    # cheapest checks first: length, then dtype kind, then index type
     try:
-        return _is_datetime_indexed(series) and _is_numeric(series) and len(series) > 1
-    except AttributeError:
-        return False
+        result = len(series) > 1 and _is_numeric(series) and _is_datetime_indexed(series)
+    except (AttributeError, TypeError):
+        result = False
+
+    if key is not None:
+        # evict the oldest entry to keep the cache bounded
+        if len(_PLOTTABLE_CACHE) >= _PLOTTABLE_CACHE_MAX_SIZE:
+            _PLOTTABLE_CACHE.pop(next(iter(_PLOTTABLE_CACHE)))
+        _PLOTTABLE_CACHE[key] = result
+
+    return result
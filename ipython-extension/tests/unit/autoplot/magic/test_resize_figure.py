@@ -9,7 +9,7 @@ import pytest
 from autoplot.utils.constants import FigSize
 
 
-@pytest.mark.parametrize("height", [FigSize.MIN_HEIGHT.value, 4.5, 6, "7", "8.9", 22 / 7, FigSize.MAX_HEIGHT.value])
+@pytest.mark.parametrize("height", [FigSize.MIN_HEIGHT, 4.5, 6, "7", "8.9", 22 / 7, FigSize.MAX_HEIGHT])
 def test_set_valid_height(height, autoplot_magic):
     magic = autoplot_magic()
     magic.autoplot(f"--height {height}")
@@ -18,7 +18,7 @@ def test_set_valid_height(height, autoplot_magic):
     assert magic.view_manager.active_view._plotter._height == pytest.approx(float(height))
 
 
-@pytest.mark.parametrize("width", [FigSize.MIN_WIDTH.value, 6.7, 8, "9", "10.1", 44 / 7, FigSize.MAX_WIDTH.value])
+@pytest.mark.parametrize("width", [FigSize.MIN_WIDTH, 6.7, 8, "9", "10.1", 44 / 7, FigSize.MAX_WIDTH])
 def test_set_valid_width(width, autoplot_magic):
     magic = autoplot_magic()
     magic.autoplot(f"--width {width}")
@@ -30,12 +30,12 @@ def test_set_valid_width(width, autoplot_magic):
 @pytest.mark.parametrize(
     "height",
     [
-        FigSize.MIN_HEIGHT.value - 1e9,
-        FigSize.MIN_HEIGHT.value - 2,
-        FigSize.MIN_HEIGHT.value - 1 / 7,
-        FigSize.MAX_HEIGHT.value + 1e9,
-        FigSize.MAX_HEIGHT.value + 2,
-        FigSize.MAX_HEIGHT.value + 1 / 7,
+        FigSize.MIN_HEIGHT - 1e9,
+        FigSize.MIN_HEIGHT - 2,
+        FigSize.MIN_HEIGHT - 1 / 7,
+        FigSize.MAX_HEIGHT + 1e9,
+        FigSize.MAX_HEIGHT + 2,
+        FigSize.MAX_HEIGHT + 1 / 7,
     ],
 )
 def test_set_height_out_of_range(mock_toast, height, autoplot_magic):
@@ -44,7 +44,7 @@ def test_set_height_out_of_range(mock_toast, height, autoplot_magic):
     magic.autoplot(f"--height {height}")
 
     # test height set to nearest boundary
-    expected = FigSize.MIN_HEIGHT.value if height <= FigSize.MIN_HEIGHT.value else FigSize.MAX_HEIGHT.value
+    expected = FigSize.MIN_HEIGHT if height <= FigSize.MIN_HEIGHT else FigSize.MAX_HEIGHT
     assert magic.view_manager.active_view._plotter._height == pytest.approx(expected)
 
     # test that a warning was shown
@@ -54,12 +54,12 @@ def test_set_height_out_of_range(mock_toast, height, autoplot_magic):
 @pytest.mark.parametrize(
     "width",
     [
-        FigSize.MIN_WIDTH.value - 1e9,
-        FigSize.MIN_WIDTH.value - 2,
-        FigSize.MIN_WIDTH.value - 1 / 7,
-        FigSize.MAX_WIDTH.value + 1e9,
-        FigSize.MAX_WIDTH.value + 2,
-        FigSize.MAX_WIDTH.value + 1 / 7,
+        FigSize.MIN_WIDTH - 1e9,
+        FigSize.MIN_WIDTH - 2,
+        FigSize.MIN_WIDTH - 1 / 7,
+        FigSize.MAX_WIDTH + 1e9,
+        FigSize.MAX_WIDTH + 2,
+        FigSize.MAX_WIDTH + 1 / 7,
     ],
 )
 def test_set_width_out_of_range(mock_toast, width, autoplot_magic):
@@ -68,7 +68,7 @@ def test_set_width_out_of_range(mock_toast, width, autoplot_magic):
     magic.autoplot(f"--width {width}")
 
     # test width set to nearest boundary
-    expected = FigSize.MIN_WIDTH.value if width <= FigSize.MIN_WIDTH.value else FigSize.MAX_WIDTH.value
+    expected = FigSize.MIN_WIDTH if width <= FigSize.MIN_WIDTH else FigSize.MAX_WIDTH
     assert magic.view_manager.active_view._plotter._width == pytest.approx(expected)
 
     # test that a warning was shown
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 from IPython.core.display import Image
 
-from autoplot.dtaler import DTaler, VarData
+from autoplot.dtaler import DTaler
 from autoplot.extensions.autoplot_display import AutoplotDisplay
 from autoplot.extensions.toast import Toast
 from ipywidgets import Output
@@ -57,11 +57,11 @@ def test_draw_new_dataframe(display_mock, dtaler):
 
     vars["df2"] = df2
     dtaler.update_variables(vars)
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert len(dtaler._tracked) == 2
+    assert len(dtaler._tracked_dd) == 2
 
 
 @patch("autoplot.dtaler.display")
@@ -76,12 +76,12 @@ def test_draw_reassigned_dataframe(display_mock, dtaler):
     new_df1 = pd.DataFrame({"a": [7, 8, 9]})
     vars["df1"] = new_df1
     dtaler.update_variables(vars)
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df1)
-    assert len(dtaler._tracked) == 2
-    assert dtaler._tracked["df1"].pdf is new_df1
+    assert len(dtaler._tracked_dd) == 2
+    assert dtaler._tracked_pdf["df1"] is new_df1
 
 
 @patch("autoplot.dtaler.display")
@@ -95,11 +95,11 @@ def test_draw_does_not_reload_hidden_df(display_mock, dtaler):
 
     vars["df1"] = pd.DataFrame({"a": [1, 2, 3]})
     dtaler.update_variables(vars)
-    output.data_id = dtaler._tracked["df2"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df2"]._data_id
     dtaler.draw(False, output)
 
     assert not display_mock.called
-    assert len(dtaler._tracked) == 2
+    assert len(dtaler._tracked_dd) == 2
 
 
 @patch("autoplot.dtaler.display")
@@ -127,14 +127,14 @@ def test_do_not_reinsert_externally_removed_frames_when_variable_is_updated(dtal
     vars = {"df1": df1, "df2": df2}
     dtaler.update_variables(vars)
 
-    dtale.global_state.cleanup(dtaler._tracked["df1"].dd._data_id)
+    dtale.global_state.cleanup(dtaler._tracked_dd["df1"]._data_id)
 
     vars["df1"] = pd.DataFrame({"a": [4, 5, 6]})
     dtaler.update_variables(vars)
 
-    assert len(dtaler._tracked) == 1
+    assert len(dtaler._tracked_dd) == 1
     assert dtaler._ignored == {"df1"}
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
 
 
 def test_do_not_reinsert_externally_removed_frames_when_variable_is_the_same(dtaler):
@@ -144,14 +144,14 @@ def test_do_not_reinsert_externally_removed_frames_when_variable_is_the_same(dta
     vars = {"df1": df1, "df2": df2}
     dtaler.update_variables(vars)
 
-    old_dd = dtaler._tracked["df1"].dd
+    old_dd = dtaler._tracked_dd["df1"]
     dtale.global_state.cleanup(old_dd._data_id)
 
     dtaler.update_variables(vars)
 
-    assert len(dtaler._tracked) == 1
+    assert len(dtaler._tracked_dd) == 1
     assert dtaler._ignored == {"df1"}
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
 
 
 @patch("autoplot.dtaler.display")
@@ -163,13 +163,13 @@ def test_draw_doesnt_reload_hidden_dfs(display_mock, dtaler):
     vars = {"df1": df1, "df2": df2}
     dtaler.update_variables(vars)
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     vars.pop("df2")
     dtaler.update_variables(vars)
     dtaler.draw(False, output)
 
     assert not display_mock.called
-    assert len(dtaler._tracked) == 1
+    assert len(dtaler._tracked_dd) == 1
 
 
 @patch("autoplot.dtaler.display")
@@ -181,13 +181,13 @@ def test_draw_reloads_when_visible_df_deleted(display_mock, dtaler):
     vars = {"df1": df1, "df2": df2}
     dtaler.update_variables(vars)
 
-    output.data_id = dtaler._tracked["df2"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df2"]._data_id
     vars.pop("df2")
     dtaler.update_variables(vars)
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df1)
-    assert len(dtaler._tracked) == 1
+    assert len(dtaler._tracked_dd) == 1
 
 
 @patch("autoplot.dtaler.display")
@@ -200,7 +200,7 @@ def test_ignore_new_variables_when_frozen(display_mock, dtaler):
     dtaler.draw(True, output)
 
     assert isinstance(_get_parameter(display_mock), Image)
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
 
 
@@ -217,7 +217,7 @@ def test_update_non_ignored_variables(display_mock, dtaler):
     dtaler.draw(True, output)
 
     assert all(_get_parameter(display_mock).data == new_df1)
-    assert dtaler._tracked["df1"].pdf is new_df1
+    assert dtaler._tracked_pdf["df1"] is new_df1
     assert "df1" not in dtaler._ignored
 
 
@@ -230,7 +230,7 @@ def test_update_ignored_variables_still_ignored(dtaler):
     new_df1 = pd.DataFrame({"b": [4, 5, 6]})
     dtaler.update_variables({"df1": new_df1})
 
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
 
 
@@ -242,7 +242,7 @@ def test_remove_ignored_variables(dtaler):
 
     dtaler.update_variables({})
 
-    assert len(dtaler._tracked) == 0
+    assert len(dtaler._tracked_dd) == 0
     assert len(dtaler._ignored) == 0
 
 
@@ -260,7 +260,7 @@ def test_continue_to_ignore_after_defrost(display_mock, dtaler):
     dtaler.draw(True, output)
 
     assert isinstance(_get_parameter(display_mock), Image)
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
 
 
@@ -279,8 +279,8 @@ def test_accept_new_variables_after_defrost(display_mock, dtaler):
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert "df1" not in dtaler._tracked
-    assert "df2" in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
+    assert "df2" in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
     assert "df2" not in dtaler._ignored
 
@@ -292,13 +292,13 @@ def test_ignore_current_variable_no_fallback(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1})
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.ignore_variable(Toast(Output()), "df1")
     dtaler.update_variables({"df1": df1})
     dtaler.draw(False, output)
 
     assert isinstance(_get_parameter(display_mock), Image)
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
 
 
@@ -310,13 +310,13 @@ def test_ignore_current_variable_with_fallback(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1, "df2": df2})
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.ignore_variable(Toast(Output()), "df1")
     dtaler.update_variables({"df1": df1, "df2": df2})
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" in dtaler._ignored
 
 
@@ -328,13 +328,13 @@ def test_ignore_other_variable_with_fallback(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1, "df2": df2})
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.ignore_variable(Toast(Output()), "df2")
     dtaler.update_variables({"df1": df1, "df2": df2})
     dtaler.draw(False, output)
 
     assert not display_mock.called
-    assert "df2" not in dtaler._tracked
+    assert "df2" not in dtaler._tracked_dd
     assert "df2" in dtaler._ignored
 
 
@@ -346,7 +346,7 @@ def test_show_ignored_variable(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1, "df2": df2})
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.ignore_variable(Toast(Output()), "df2")
     dtaler.update_variables({"df1": df1, "df2": df2})
 
@@ -355,7 +355,7 @@ def test_show_ignored_variable(display_mock, dtaler):
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert "df2" in dtaler._tracked
+    assert "df2" in dtaler._tracked_dd
     assert "df2" not in dtaler._ignored
 
 
@@ -367,13 +367,13 @@ def test_show_variable(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1, "df2": df2})
 
-    output.data_id = dtaler._tracked["df2"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df2"]._data_id
     dtaler.show_variable(Toast(Output()), "df1")
     dtaler.update_variables({"df1": df1, "df2": df2})
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df1)
-    assert "df2" in dtaler._tracked
+    assert "df2" in dtaler._tracked_dd
     assert "df2" not in dtaler._ignored
 
 
@@ -385,12 +385,12 @@ def test_show_frozen_variable(display_mock, dtaler):
 
     dtaler.update_variables({"df1": df1})
 
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
     dtaler.freeze(Toast(Output()))
 
     dtaler.update_variables({"df1": df1, "df2": df2})
 
-    assert "df2" not in dtaler._tracked
+    assert "df2" not in dtaler._tracked_dd
     assert "df2" in dtaler._ignored
 
     dtaler.show_variable(Toast(Output()), "df2")
@@ -398,7 +398,7 @@ def test_show_frozen_variable(display_mock, dtaler):
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert "df2" in dtaler._tracked
+    assert "df2" in dtaler._tracked_dd
     assert "df2" not in dtaler._ignored
 
 
@@ -409,18 +409,18 @@ def test_delete_from_dtale_and_namespace(display_mock, dtaler):
     output = AutoplotDisplay()
 
     dtaler.update_variables({"df1": df1, "df2": df2})
-    output.data_id = dtaler._tracked["df1"].dd._data_id
+    output.data_id = dtaler._tracked_dd["df1"]._data_id
 
-    dtale.global_state.cleanup(dtaler._tracked["df1"].dd._data_id)
+    dtale.global_state.cleanup(dtaler._tracked_dd["df1"]._data_id)
     dtaler.update_variables({"df2": df2})
     dtaler.draw(False, output)
 
     assert all(_get_parameter(display_mock).data == df2)
-    assert "df1" not in dtaler._tracked
+    assert "df1" not in dtaler._tracked_dd
     assert "df1" not in dtaler._ignored
 
 
-def _get_parameter(display_mock) -> Union[Image, VarData]:
+def _get_parameter(display_mock) -> Union[Image, dtale.views.DtaleData]:
     return display_mock.call_args[0][0]
 
 
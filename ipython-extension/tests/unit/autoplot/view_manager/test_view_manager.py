@@ -260,3 +260,62 @@ def test_invalid_view_name_constructor():
     b = TestView()
     with pytest.raises(ValueError):
         ViewManager(AutoplotDisplay(), shell, {"a": a, "b": b}, "c")
+
+
+def test_redraw_with_raw_cell_only_rechecks_referenced_names():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    other = pd.DataFrame({"b": [4, 5, 6]})
+    shell = MockIPythonShell({"df": df, "other": other})
+    a = TestView()
+    manager = ViewManager(AutoplotDisplay(), shell, {"a": a}, "a")
+
+    manager.redraw()
+    assert a.variables == {"df": df, "other": other}
+
+    # a parseable cell referencing only "df" re-checks just that name
+    del shell.user_ns["other"]
+    shell.user_ns["df"] = replaced = pd.DataFrame({"a": [7, 8, 9]})
+    manager.redraw("df = df * 2")
+
+    assert a.variables == {"df": replaced, "other": other}
+
+    # an unparseable cell (e.g. a magic) falls back to a full scan
+    manager.redraw("%autoplot -w 5")
+
+    assert a.variables == {"df": replaced}
+
+
+def test_redraw_with_raw_cell_detects_deletions():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    shell = MockIPythonShell({"df": df})
+    a = TestView()
+    manager = ViewManager(AutoplotDisplay(), shell, {"a": a}, "a")
+
+    manager.redraw()
+    assert a.variables == {"df": df}
+
+    del shell.user_ns["df"]
+    manager.redraw("del df")
+
+    assert a.variables == {}
+
+
+def test_redraw_skips_pure_display_cells():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    shell = MockIPythonShell({"df": df})
+    a = TestView()
+    manager = ViewManager(AutoplotDisplay(), shell, {"a": a}, "a")
+
+    manager.redraw()
+    assert a.variables == {"df": df}
+
+    # a display-only cell must not trigger another update
+    a.variables = None
+    manager.redraw("df")
+
+    assert a.variables is None
+
+    # but a cell containing a call might mutate, so it must update
+    manager.redraw("df.head()")
+
+    assert a.variables == {"df": df}